@@ -1,107 +1,457 @@
 """A2A messaging functionality for sending messages to agents."""
 
+import asyncio
+import contextlib
+import hashlib
 import json
-import httpx
-from typing import Optional
-from uuid import uuid4
+import os
+import time
+from typing import AsyncIterator, Awaitable, Callable, Optional
 
-from a2a.client import A2ACardResolver, A2AClient
+import httpx
+from a2a.client import A2ACardResolver, A2AClient, A2AClientHTTPError
+from a2a.client.errors import (
+    A2AClientJSONError,
+    A2AClientJSONRPCError,
+    A2AClientTimeoutError,
+)
 from a2a.types import (
     AgentCard,
+    JSONRPCErrorResponse,
+    Message,
+    MessageSendParams,
+    Part,
+    Role,
     SendMessageRequest,
     SendStreamingMessageRequest,
-    MessageSendParams,
+    SendStreamingMessageResponse,
+    TextPart,
 )
+from httpx_sse import SSEError, aconnect_sse
+
+from . import jsonutil
+from .http_client import get_http_client
 
 
 EXTENDED_AGENT_CARD_PATH = "/.well-known/agent.json"
 
+# How long a resolved agent card is reused before it is fetched again
+AGENT_CARD_TTL = float(os.getenv("AGENT_CARD_TTL", "300"))
 
-async def send_message_to_agent(
+# (agent_url, use_extended_card, token_hash) -> (expires_at, card)
+_card_cache: dict[tuple, tuple[float, AgentCard]] = {}
+
+# Same key -> card fetch currently in flight
+_card_fetches: dict[tuple, asyncio.Future] = {}
+
+# Same key -> (card, httpx client, A2AClient) built from that card
+_client_cache: dict[tuple, tuple[AgentCard, httpx.AsyncClient, A2AClient]] = {}
+
+# Errors after which the cached card and client for an agent are dropped
+_CONNECTION_ERRORS = (
+    A2AClientHTTPError,
+    A2AClientTimeoutError,
+    httpx.TransportError,
+)
+
+# Streamed chunks are grouped until roughly one Ethernet frame of payload is
+# buffered, or until the oldest buffered chunk has waited CHUNK_FLUSH_MS.
+CHUNK_BUFFER_BYTES = int(os.getenv("CHUNK_BUFFER_BYTES", "1490"))
+CHUNK_FLUSH_MS = int(os.getenv("CHUNK_FLUSH_MS", "50"))
+CHUNK_SEPARATOR = "\n\n"
+# Chunks read ahead of the consumer before the upstream read is paused
+CHUNK_QUEUE_SIZE = 64
+
+_STREAM_END = object()
+
+
+def _hash_token(token: Optional[str]) -> Optional[str]:
+    """Hash an auth token so it can be used as a cache key without storing it."""
+    if not token:
+        return None
+    return hashlib.blake2b(token.encode(), digest_size=16).hexdigest()
+
+
+def _card_key(
+    agent_url: str,
+    auth_token: Optional[str],
+    use_extended_card: bool,
+) -> tuple:
+    """
+    Build the cache key for an agent's card and client.
+
+    Args:
+        agent_url: The base URL of the agent
+        auth_token: Optional OAuth token used for the extended card
+        use_extended_card: Whether the extended agent card was requested
+
+    Returns:
+        Tuple of (agent_url, use_extended_card, token_hash)
+    """
+    # Without a token only the public card can be fetched, and the public
+    # card does not depend on the caller, so those requests share an entry
+    if not (auth_token and use_extended_card):
+        return (agent_url, False, None)
+    return (agent_url, True, _hash_token(auth_token))
+
+
+async def _get_cached_card(
+    key: tuple,
+    fetch: Callable[[], Awaitable[tuple[AgentCard, bool]]],
+) -> AgentCard:
+    """
+    Return a cached agent card, calling fetch on a miss or after expiry.
+
+    Concurrent misses for the same key share a single in-flight fetch.
+
+    Args:
+        key: Cache key from _card_key
+        fetch: Coroutine function that resolves the card from the agent,
+            as returned by _resolve_card
+
+    Returns:
+        The resolved agent card
+    """
+    cached = _card_cache.get(key)
+    if cached and cached[0] > time.monotonic():
+        return cached[1]
+
+    task = _card_fetches.get(key)
+    if task is None:
+        task = asyncio.ensure_future(_fetch_card(key, fetch))
+        _card_fetches[key] = task
+        task.add_done_callback(lambda _: _card_fetches.pop(key, None))
+
+    # Shield the shared fetch so one caller giving up doesn't cancel it for
+    # everyone else waiting on it
+    return await asyncio.shield(task)
+
+
+async def _fetch_card(
+    key: tuple,
+    fetch: Callable[[], Awaitable[tuple[AgentCard, bool]]],
+) -> AgentCard:
+    """Fetch a card and store it, dropping entries that have expired."""
+    card, cacheable = await fetch()
+    # A fallback card stands in for one we failed to get; retry next time
+    if cacheable and AGENT_CARD_TTL > 0:
+        now = time.monotonic()
+        # Agent URLs come from callers, so don't let stale entries pile up
+        expired = [k for k, (expires_at, _) in _card_cache.items() if expires_at <= now]
+        for expired_key in expired:
+            del _card_cache[expired_key]
+            _client_cache.pop(expired_key, None)
+        _card_cache[key] = (now + AGENT_CARD_TTL, card)
+    return card
+
+
+def _get_client(key: tuple, card: AgentCard) -> A2AClient:
+    """
+    Return the A2AClient for a card, reusing the one built last time.
+
+    A new client is built when the card has been re-resolved or the shared
+    httpx client has been replaced.
+
+    Args:
+        key: Cache key from _card_key
+        card: The agent card the client should target
+
+    Returns:
+        A2AClient bound to the shared httpx client
+    """
+    httpx_client = get_http_client()
+    cached = _client_cache.get(key)
+    if cached and cached[0] is card and cached[1] is httpx_client:
+        return cached[2]
+
+    client = A2AClient(httpx_client=httpx_client, agent_card=card)
+    # Clients live only as long as their card's cache entry
+    if key in _card_cache:
+        _client_cache[key] = (card, httpx_client, client)
+    return client
+
+
+def _invalidate(key: tuple) -> None:
+    """Forget the cached card and client so the next call re-resolves them."""
+    _card_cache.pop(key, None)
+    _client_cache.pop(key, None)
+
+
+async def _resolve_card(
+    httpx_client: httpx.AsyncClient,
     agent_url: str,
-    message: str,
     auth_token: Optional[str] = None,
     use_extended_card: bool = False,
-) -> str:
+) -> tuple[AgentCard, bool]:
     """
-    Send a message to an A2A agent and get the response.
+    Fetch an agent's card, preferring the extended card when requested.
 
     Args:
-        agent_url: The base URL of the agent (from AgentCard status.card.url)
-        message: The message text to send
+        httpx_client: HTTP client used for the card requests
+        agent_url: The base URL of the agent
+        auth_token: Optional OAuth token for the extended card request
+        use_extended_card: Whether to attempt fetching the extended agent card
+
+    Returns:
+        Tuple of (card, cacheable). The card is the extended card if requested
+        and available, otherwise the public card. cacheable is False when the
+        public card is only a fallback for a failed extended card request.
+    """
+    want_extended = bool(auth_token and use_extended_card)
+
+    resolver = A2ACardResolver(
+        httpx_client=httpx_client,
+        base_url=agent_url,
+    )
+
+    try:
+        # Try to get the public agent card first
+        public_card = await resolver.get_agent_card()
+
+        # The public card is all we need unless an extended one was requested
+        if not want_extended:
+            return public_card, True
+
+        # If the agent offers an extended card, try to get it
+        if public_card.supports_authenticated_extended_card:
+            try:
+                auth_headers_dict = {"Authorization": f"Bearer {auth_token}"}
+                extended_card = await resolver.get_agent_card(
+                    relative_card_path=EXTENDED_AGENT_CARD_PATH,
+                    http_kwargs={"headers": auth_headers_dict},
+                )
+                return extended_card, True
+            except Exception:
+                # Fall back to public card if extended card fails
+                return public_card, False
+
+        return public_card, True
+
+    except Exception as e:
+        raise Exception(f"Failed to fetch agent card from {agent_url}: {e}")
+
+
+async def _get_agent_card(
+    agent_url: str,
+    auth_token: Optional[str] = None,
+    use_extended_card: bool = False,
+) -> tuple[tuple, AgentCard]:
+    """
+    Resolve an agent's card, using the card cache.
+
+    Args:
+        agent_url: The base URL of the agent
         auth_token: Optional OAuth token for authenticated requests
         use_extended_card: Whether to attempt fetching the extended agent card
 
     Returns:
-        JSON response from the agent
+        Tuple of (cache key, agent card)
     """
-    async with httpx.AsyncClient(verify=False, timeout=30) as httpx_client:
-        # Initialize A2ACardResolver
-        resolver = A2ACardResolver(
-            httpx_client=httpx_client,
-            base_url=agent_url,
-        )
+    key = _card_key(agent_url, auth_token, use_extended_card)
+    card = await _get_cached_card(
+        key,
+        lambda: _resolve_card(
+            get_http_client(), agent_url, auth_token, use_extended_card
+        ),
+    )
+    return key, card
 
-        # Fetch agent card
-        final_agent_card_to_use: AgentCard | None = None
 
-        try:
-            # Try to get the public agent card first
-            public_card = await resolver.get_agent_card()
-            final_agent_card_to_use = public_card
-
-            # If auth token provided and extended card requested, try to get it
-            if (
-                auth_token
-                and use_extended_card
-                and public_card.supports_authenticated_extended_card
-            ):
-                try:
-                    auth_headers_dict = {"Authorization": f"Bearer {auth_token}"}
-                    extended_card = await resolver.get_agent_card(
-                        relative_card_path=EXTENDED_AGENT_CARD_PATH,
-                        http_kwargs={"headers": auth_headers_dict},
-                    )
-                    final_agent_card_to_use = extended_card
-                except Exception:
-                    # Fall back to public card if extended card fails
-                    pass
+async def _get_agent_client(
+    agent_url: str,
+    auth_token: Optional[str] = None,
+    use_extended_card: bool = False,
+) -> tuple[tuple, AgentCard, A2AClient]:
+    """
+    Resolve an agent's card and return a client for it, using the caches.
 
-        except Exception as e:
-            raise Exception(f"Failed to fetch agent card from {agent_url}: {e}")
+    Args:
+        agent_url: The base URL of the agent
+        auth_token: Optional OAuth token for authenticated requests
+        use_extended_card: Whether to attempt fetching the extended agent card
 
-        # Initialize client and send message
-        client = A2AClient(
-            httpx_client=httpx_client, agent_card=final_agent_card_to_use
-        )
+    Returns:
+        Tuple of (cache key, agent card, A2AClient)
+    """
+    key, card = await _get_agent_card(agent_url, auth_token, use_extended_card)
+    return key, card, _get_client(key, card)
+
+
+async def _stream_raw_events(
+    url: str,
+    request: SendStreamingMessageRequest,
+) -> AsyncIterator[str]:
+    """
+    Send a streaming request and yield each SSE event's JSON payload as-is.
+
+    This mirrors the SDK's JSON-RPC streaming transport, including how it
+    maps transport errors, but skips validating every event into pydantic
+    models. Each event is decoded only to check for a top-level "error" key;
+    error responses are validated and raised instead of forwarded. The
+    bridge's clients have no interceptors, and the shared httpx client
+    supplies the same default headers the SDK would send.
+
+    Args:
+        url: The agent's JSON-RPC endpoint (from the agent card)
+        request: The streaming request to send
+
+    Yields:
+        The data field of each server-sent event
+
+    Raises:
+        A2AClientHTTPError: If an HTTP, SSE or network error occurs
+        A2AClientTimeoutError: If the request times out
+        A2AClientJSONError: If an event is not a JSON object
+        A2AClientJSONRPCError: If the agent sends a JSON-RPC error response
+    """
+    payload = request.model_dump(mode="json", exclude_none=True)
+
+    try:
+        async with aconnect_sse(
+            get_http_client(), "POST", url, json=payload
+        ) as event_source:
+            event_source.response.raise_for_status()
+            async for sse in event_source.aiter_sse():
+                if not sse.data:
+                    continue
+                event = jsonutil.loads(sse.data)
+                if not isinstance(event, dict):
+                    raise A2AClientJSONError("SSE event is not a JSON object")
+                if "error" in event:
+                    response = SendStreamingMessageResponse.model_validate(event)
+                    if isinstance(response.root, JSONRPCErrorResponse):
+                        raise A2AClientJSONRPCError(response.root)
+                yield sse.data
+    except httpx.TimeoutException as e:
+        raise A2AClientTimeoutError("Client Request timed out") from e
+    except httpx.HTTPStatusError as e:
+        raise A2AClientHTTPError(e.response.status_code, str(e)) from e
+    except SSEError as e:
+        raise A2AClientHTTPError(
+            400, f"Invalid SSE response or protocol error: {e}"
+        ) from e
+    except json.JSONDecodeError as e:
+        raise A2AClientJSONError(str(e)) from e
+    except httpx.RequestError as e:
+        raise A2AClientHTTPError(
+            503, f"Network communication error: {e}"
+        ) from e
+
+
+def _new_ids() -> tuple[str, str]:
+    """
+    Generate a JSON-RPC request id and a message id.
+
+    Both come from a single 32-byte urandom read rather than two uuid4 calls.
+
+    Returns:
+        Tuple of (request_id, message_id) as hex strings
+    """
+    raw = os.urandom(32).hex()
+    return raw[:32], raw[32:]
 
-        send_message_payload = {
-            "message": {
-                "role": "user",
-                "parts": [{"kind": "text", "text": message}],
-                "messageId": uuid4().hex,
-            },
-        }
 
-        request = SendMessageRequest(
-            id=str(uuid4()), params=MessageSendParams(**send_message_payload)
+def _build_message_params(message: str, message_id: str) -> MessageSendParams:
+    """
+    Build the send parameters for a single user text message.
+
+    The models are constructed directly instead of validating a nested dict.
+
+    Args:
+        message: The message text to send
+        message_id: Unique id for the message
+
+    Returns:
+        MessageSendParams wrapping the user message
+    """
+    return MessageSendParams(
+        message=Message(
+            role=Role.user,
+            parts=[Part(root=TextPart(text=message))],
+            messageId=message_id,
         )
+    )
+
 
+async def _coalesce_chunks(chunks: AsyncIterator[str]) -> AsyncIterator[str]:
+    """
+    Group serialized chunks into larger batches before they are emitted.
+
+    A batch is flushed once it holds CHUNK_BUFFER_BYTES of UTF-8 text, or
+    once its first chunk has been buffered for CHUNK_FLUSH_MS, so no chunk
+    is held back longer than that however fast small chunks arrive. The
+    upstream iterator is consumed by a single producer task, which keeps the
+    underlying HTTP stream in one task; the bounded queue pauses it when the
+    consumer falls behind.
+
+    Args:
+        chunks: Serialized chunks in arrival order
+
+    Yields:
+        Batches of chunks joined with CHUNK_SEPARATOR
+    """
+    queue: asyncio.Queue = asyncio.Queue(maxsize=CHUNK_QUEUE_SIZE)
+
+    async def produce() -> None:
         try:
-            response = await client.send_message(request)
-            return f"Response from {agent_url}:\n\n{response.model_dump_json(indent=2, exclude_none=True)}"
+            async for chunk in chunks:
+                await queue.put(chunk)
         except Exception as e:
-            raise Exception(f"Failed to send message to agent: {e}")
+            await queue.put(e)
+        else:
+            await queue.put(_STREAM_END)
 
+    producer = asyncio.create_task(produce())
+    loop = asyncio.get_running_loop()
+    flush_interval = CHUNK_FLUSH_MS / 1000
+    buffer: list[str] = []
+    buffered = 0
+    deadline = 0.0
 
-async def send_streaming_message_to_agent(
+    try:
+        while True:
+            timeout = max(deadline - loop.time(), 0) if buffer else None
+            try:
+                item = await asyncio.wait_for(queue.get(), timeout=timeout)
+            except asyncio.TimeoutError:
+                # The oldest buffered chunk has waited long enough
+                yield CHUNK_SEPARATOR.join(buffer)
+                buffer, buffered = [], 0
+                continue
+
+            if item is _STREAM_END:
+                break
+            if isinstance(item, Exception):
+                raise item
+
+            if not buffer:
+                deadline = loop.time() + flush_interval
+            buffer.append(item)
+            buffered += len(item.encode())
+            if buffered >= CHUNK_BUFFER_BYTES:
+                yield CHUNK_SEPARATOR.join(buffer)
+                buffer, buffered = [], 0
+
+        if buffer:
+            yield CHUNK_SEPARATOR.join(buffer)
+    finally:
+        # Stop reading and release the upstream stream even if the consumer
+        # stopped early
+        producer.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await producer
+        if hasattr(chunks, "aclose"):
+            await chunks.aclose()
+
+
+async def send_message_to_agent(
     agent_url: str,
     message: str,
     auth_token: Optional[str] = None,
     use_extended_card: bool = False,
 ) -> str:
     """
-    Send a streaming message to an A2A agent and get the streaming response.
+    Send a message to an A2A agent and get the response.
 
     Args:
         agent_url: The base URL of the agent (from AgentCard status.card.url)
@@ -110,70 +460,77 @@ async def send_streaming_message_to_agent(
         use_extended_card: Whether to attempt fetching the extended agent card
 
     Returns:
-        All streaming response chunks from the agent as JSON
+        JSON response from the agent
     """
-    async with httpx.AsyncClient(verify=False, timeout=30) as httpx_client:
-        # Initialize A2ACardResolver
-        resolver = A2ACardResolver(
-            httpx_client=httpx_client,
-            base_url=agent_url,
-        )
+    key, _, client = await _get_agent_client(
+        agent_url, auth_token, use_extended_card
+    )
 
-        # Fetch agent card
-        final_agent_card_to_use: AgentCard | None = None
+    request_id, message_id = _new_ids()
+    request = SendMessageRequest(
+        id=request_id, params=_build_message_params(message, message_id)
+    )
 
-        try:
-            # Try to get the public agent card first
-            public_card = await resolver.get_agent_card()
-            final_agent_card_to_use = public_card
-
-            # If auth token provided and extended card requested, try to get it
-            if (
-                auth_token
-                and use_extended_card
-                and public_card.supports_authenticated_extended_card
-            ):
-                try:
-                    auth_headers_dict = {"Authorization": f"Bearer {auth_token}"}
-                    extended_card = await resolver.get_agent_card(
-                        relative_card_path=EXTENDED_AGENT_CARD_PATH,
-                        http_kwargs={"headers": auth_headers_dict},
-                    )
-                    final_agent_card_to_use = extended_card
-                except Exception:
-                    # Fall back to public card if extended card fails
-                    pass
+    try:
+        response = await client.send_message(request)
+        return f"Response from {agent_url}:\n\n{response.model_dump_json(indent=2, exclude_none=True)}"
+    except Exception as e:
+        if isinstance(e, _CONNECTION_ERRORS):
+            # The agent may have moved or restarted; re-resolve it next time
+            _invalidate(key)
+        raise Exception(f"Failed to send message to agent: {e}")
 
-        except Exception as e:
-            raise Exception(f"Failed to fetch agent card from {agent_url}: {e}")
 
-        # Initialize client and send streaming message
-        client = A2AClient(
-            httpx_client=httpx_client, agent_card=final_agent_card_to_use
-        )
+async def send_streaming_message_to_agent(
+    agent_url: str,
+    message: str,
+    auth_token: Optional[str] = None,
+    use_extended_card: bool = False,
+    pretty: bool = False,
+) -> AsyncIterator[str]:
+    """
+    Send a streaming message to an A2A agent and yield the response chunks.
 
-        send_message_payload = {
-            "message": {
-                "role": "user",
-                "parts": [{"kind": "text", "text": message}],
-                "messageId": uuid4().hex,
-            },
-        }
+    Args:
+        agent_url: The base URL of the agent (from AgentCard status.card.url)
+        message: The message text to send
+        auth_token: Optional OAuth token for authenticated requests
+        use_extended_card: Whether to attempt fetching the extended agent card
+        pretty: Indent each chunk for readability instead of compact JSON
 
-        streaming_request = SendStreamingMessageRequest(
-            id=str(uuid4()), params=MessageSendParams(**send_message_payload)
-        )
+    Yields:
+        Batches of streaming response chunks from the agent as JSON, in
+        arrival order. Unless pretty is set, chunks are forwarded exactly as
+        the agent sent them.
+    """
+    key, card = await _get_agent_card(agent_url, auth_token, use_extended_card)
 
-        try:
-            stream_response = client.send_message_streaming(streaming_request)
+    request_id, message_id = _new_ids()
+    streaming_request = SendStreamingMessageRequest(
+        id=request_id, params=_build_message_params(message, message_id)
+    )
 
-            result_chunks = []
-            async for chunk in stream_response:
-                result_chunks.append(chunk.model_dump(mode="json", exclude_none=True))
+    try:
+        if pretty:
+            client = _get_client(key, card)
+            stream_response = client.send_message_streaming(streaming_request)
 
-            return f"Streaming response from {agent_url}:\n\n" + "\n\n".join(
-                [json.dumps(chunk, indent=2) for chunk in result_chunks]
+            # pydantic-core serializes straight from the model, with no
+            # intermediate dict
+            serialized = (
+                chunk.model_dump_json(indent=2, exclude_none=True)
+                async for chunk in stream_response
             )
+        else:
+            # Forward the agent's own JSON without a parse/serialize round trip
+            serialized = _stream_raw_events(card.url, streaming_request)
 
-        except Exception as e:
-            raise Exception(f"Failed to send streaming message to agent: {e}")
+        # Hand chunks on as they arrive, grouping small ones together
+        async for batch in _coalesce_chunks(serialized):
+            yield batch
+
+    except Exception as e:
+        if isinstance(e, _CONNECTION_ERRORS):
+            # The agent may have moved or restarted; re-resolve it next time
+            _invalidate(key)
+        raise Exception(f"Failed to send streaming message to agent: {e}")
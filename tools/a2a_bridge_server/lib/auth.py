@@ -9,10 +9,18 @@ Allowing for either:
 """
 
 import os
+import asyncio
 import contextvars
+import functools
+import hashlib
 import logging
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
 from kubernetes import config as k8s_config
 from kubernetes.client import ApiClient, Configuration
+from kubernetes_asyncio import client as async_client
+from kubernetes_asyncio import config as async_k8s_config
 
 
 # Set up logging
@@ -20,6 +28,17 @@ logging.basicConfig(level=logging.INFO)
 
 _current_token = contextvars.ContextVar('current_token', default=None)
 
+# Async API clients keyed by token hash, most recently used last. Each client
+# owns an aiohttp session, so reusing it keeps the connection pool warm.
+ASYNC_CLIENT_CACHE_SIZE = 64
+_async_clients: "OrderedDict[str, async_client.ApiClient]" = OrderedDict()
+# Number of in-progress uses of each client handed out by async_k8s_client
+_async_client_users: dict[async_client.ApiClient, int] = {}
+# Clients evicted from the cache while still in use; closed by their last user
+_retired_clients: set[async_client.ApiClient] = set()
+_async_kubeconfig_client: async_client.ApiClient | None = None
+_async_kubeconfig_lock = asyncio.Lock()
+
 
 def set_auth_context(token: str | None) -> None:
     """
@@ -31,6 +50,34 @@ def set_auth_context(token: str | None) -> None:
     _current_token.set(token)
 
 
+@functools.lru_cache(maxsize=None)
+def _cluster_settings() -> tuple[str, str | None, bool]:
+    """
+    Resolve the API server host and TLS settings once per process.
+
+    Token clients only differ in their bearer token, so the kubeconfig is
+    read on first use instead of on every request.
+
+    Returns:
+        Tuple of (host, ssl_ca_cert, verify_ssl)
+    """
+    if os.path.exists('/var/run/secrets/kubernetes.io/serviceaccount/token'):
+        # Running in-cluster
+        ca_cert = "/var/run/secrets/kubernetes.io/serviceaccount/ca.crt"
+        if not os.path.exists(ca_cert):
+            ca_cert = None
+        return "https://kubernetes.default.svc", ca_cert, True
+
+    # Running locally - get API server URL from kubeconfig
+    config = Configuration()
+    try:
+        k8s_config.load_incluster_config(client_configuration=config)
+    except k8s_config.ConfigException:
+        k8s_config.load_kube_config(client_configuration=config)
+
+    return config.host, config.ssl_ca_cert, config.verify_ssl
+
+
 def create_k8s_client_from_token(jwt_token: str) -> ApiClient:
     """
     Create a Kubernetes API client using a user's JWT token.
@@ -42,26 +89,7 @@ def create_k8s_client_from_token(jwt_token: str) -> ApiClient:
         Kubernetes API client configured with the user's token
     """
     config = Configuration()
-
-    # Determine API server URL and CA cert
-    if os.path.exists('/var/run/secrets/kubernetes.io/serviceaccount/token'):
-        # Running in-cluster
-        config.host = "https://kubernetes.default.svc"
-        ca_cert = "/var/run/secrets/kubernetes.io/serviceaccount/ca.crt"
-        if os.path.exists(ca_cert):
-            config.ssl_ca_cert = ca_cert
-    else:
-        # Running locally - get API server URL from kubeconfig
-        try:
-            k8s_config.load_incluster_config()
-        except k8s_config.ConfigException:
-            k8s_config.load_kube_config()
-
-        # Get the host and SSL CA cert from the loaded config
-        default_config = Configuration.get_default_copy()
-        config.host = default_config.host
-        config.ssl_ca_cert = default_config.ssl_ca_cert
-        config.verify_ssl = default_config.verify_ssl
+    config.host, config.ssl_ca_cert, config.verify_ssl = _cluster_settings()
 
     # Use the user's JWT as bearer token
     # Let the client library add the "Bearer" prefix via api_key_prefix
@@ -96,3 +124,130 @@ def create_k8s_client(token_auth_only=False):
         logging.info("Falling back to local kubeconfig for client auth.")
         return create_k8s_client_from_kubeconfig() 
     raise ValueError("Unable to create kubernetes api client: no JWT token supplied.")
+
+
+def _token_key(jwt_token: str) -> str:
+    return hashlib.blake2b(jwt_token.encode(), digest_size=16).hexdigest()
+
+
+def current_token_hash() -> str | None:
+    """
+    Hash of the current request's JWT, for use in cache keys.
+
+    Returns:
+        Hex digest of the token, or None when no token was supplied
+    """
+    jwt_token = _current_token.get()
+    return _token_key(jwt_token) if jwt_token else None
+
+
+async def create_async_k8s_client_from_token(jwt_token: str) -> async_client.ApiClient:
+    """
+    Get an async Kubernetes API client for a user's JWT token.
+
+    Clients are cached per token so repeated requests from the same caller
+    share one aiohttp connection pool.
+
+    Args:
+        jwt_token: JWT token issued by the Kubernetes API.
+
+    Returns:
+        kubernetes_asyncio API client configured with the user's token
+    """
+    key = _token_key(jwt_token)
+    api_client = _async_clients.get(key)
+    if api_client is not None:
+        _async_clients.move_to_end(key)
+        return api_client
+
+    config = async_client.Configuration()
+    config.host, config.ssl_ca_cert, config.verify_ssl = _cluster_settings()
+
+    config.api_key = {"authorization": jwt_token}
+    config.api_key_prefix = {"authorization": "Bearer"}
+
+    api_client = async_client.ApiClient(configuration=config)
+    _async_clients[key] = api_client
+
+    if len(_async_clients) > ASYNC_CLIENT_CACHE_SIZE:
+        # The least recently used client has been idle the longest, but may
+        # still be mid-request; if so its last user closes it
+        _, evicted = _async_clients.popitem(last=False)
+        if evicted in _async_client_users:
+            _retired_clients.add(evicted)
+        else:
+            await evicted.close()
+
+    return api_client
+
+
+async def create_async_k8s_client_from_kubeconfig() -> async_client.ApiClient:
+    """Get the shared async Kubernetes API client built from local config."""
+    global _async_kubeconfig_client
+    async with _async_kubeconfig_lock:
+        if _async_kubeconfig_client is None:
+            config = async_client.Configuration()
+            try:
+                async_k8s_config.load_incluster_config(client_configuration=config)
+            except async_k8s_config.ConfigException:
+                await async_k8s_config.load_kube_config(client_configuration=config)
+            _async_kubeconfig_client = async_client.ApiClient(configuration=config)
+    return _async_kubeconfig_client
+
+
+async def create_async_k8s_client(token_auth_only=False) -> async_client.ApiClient:
+    """
+    Async counterpart of create_k8s_client.
+
+    Returns a cached kubernetes_asyncio client for the current request's token,
+    or the shared kubeconfig client when no token is available and
+    token_auth_only is False.
+    """
+    jwt_token = _current_token.get()
+    if jwt_token:
+        logging.info("Using supplied JWT token for client auth.")
+        return await create_async_k8s_client_from_token(jwt_token)
+    elif not token_auth_only:
+        logging.info("Falling back to local kubeconfig for client auth.")
+        return await create_async_k8s_client_from_kubeconfig()
+    raise ValueError("Unable to create kubernetes api client: no JWT token supplied.")
+
+
+@asynccontextmanager
+async def async_k8s_client(token_auth_only=False) -> AsyncIterator[async_client.ApiClient]:
+    """
+    Use the current request's async Kubernetes API client.
+
+    The client is not closed while the context is open, even if it is
+    evicted from the cache in the meantime.
+
+    Args:
+        token_auth_only: Refuse to fall back to local kubeconfig
+
+    Yields:
+        kubernetes_asyncio API client, as returned by create_async_k8s_client
+    """
+    api_client = await create_async_k8s_client(token_auth_only)
+    _async_client_users[api_client] = _async_client_users.get(api_client, 0) + 1
+    try:
+        yield api_client
+    finally:
+        users = _async_client_users.pop(api_client) - 1
+        if users:
+            _async_client_users[api_client] = users
+        elif api_client in _retired_clients:
+            _retired_clients.discard(api_client)
+            await api_client.close()
+
+
+async def close_async_k8s_clients() -> None:
+    """Close every cached async Kubernetes API client."""
+    global _async_kubeconfig_client
+    clients = list(_async_clients.values()) + list(_retired_clients)
+    _async_clients.clear()
+    _retired_clients.clear()
+    if _async_kubeconfig_client is not None:
+        clients.append(_async_kubeconfig_client)
+        _async_kubeconfig_client = None
+    for api_client in clients:
+        await api_client.close()
@@ -1,24 +1,44 @@
 """Agent discovery functionality using Kubernetes AgentCard CRDs."""
 
-import json
-from typing import Optional, Dict, Any, List
-from kubernetes import client
-from kubernetes.client.exceptions import ApiException
-from . import auth
+import asyncio
+import os
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field, fields
+from functools import lru_cache
+from typing import AsyncIterator, Callable, Optional, Dict, Any, List
+from kubernetes_asyncio import client
+from kubernetes_asyncio.client.exceptions import ApiException
+from . import auth, jsonutil
 
 
-def _get_k8s_client() -> client.CustomObjectsApi:
+# Parsed agent listings are reused for AGENTS_CACHE_TTL seconds, so a burst of
+# discovery calls costs one Kubernetes API round trip.
+AGENTS_CACHE_TTL = float(os.getenv("AGENTS_CACHE_TTL", "5"))
+
+# (namespace, token_hash) -> (expires_at, agents)
+_agents_cache: dict[tuple, tuple[float, List["AgentInfo"]]] = {}
+
+# (namespace, token_hash) -> AgentCard list request currently in flight
+_in_flight: dict[tuple, asyncio.Future] = {}
+
+# Column layout of the list_agents summary table
+_ROW_FMT = "{:<25} {:<12} {:<10} {:<8} {:<20} {:<50}\n"
+
+
+@asynccontextmanager
+async def _get_k8s_client() -> AsyncIterator[client.CustomObjectsApi]:
     """
     Get a Kubernetes API client for the current request.
 
     Uses the authenticated user's JWT if available (from Authorino headers),
     otherwise falls back to default configuration.
 
-    Returns:
-        Kubernetes CustomObjectsApi client
+    Yields:
+        Kubernetes CustomObjectsApi client, usable until the context exits
     """
-    api_client = auth.create_k8s_client()
-    return client.CustomObjectsApi(api_client)
+    async with auth.async_k8s_client() as api_client:
+        yield client.CustomObjectsApi(api_client)
 
 
 def get_namespace_scope(
@@ -48,37 +68,63 @@ def get_namespace_scope(
         return "default", "namespace: default"
 
 
-def discover_agent_cards(
+async def discover_agent_cards(
     namespace: Optional[str] = None
 ) -> List[Dict[str, Any]]:
     """
     Discover AgentCard resources using Kubernetes API.
 
+    Concurrent calls for the same namespace and caller share a single
+    in-flight API request.
+
     Args:
         namespace: Specific namespace to search, or None for all namespaces
 
     Returns:
         List of AgentCard CRD objects as dictionaries
     """
-    try:
-        custom_api = _get_k8s_client()
+    key = (namespace, auth.current_token_hash())
+    task = _in_flight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(_list_agent_cards(namespace))
+        _in_flight[key] = task
+        task.add_done_callback(lambda _: _in_flight.pop(key, None))
 
-        # Call the appropriate API method based on namespace scope
-        if namespace is None:
-            # List across all namespaces
-            result = custom_api.list_cluster_custom_object(
-                group="agent.kagenti.dev",
-                version="v1alpha1",
-                plural="agentcards"
-            )
-        else:
-            # List in specific namespace
-            result = custom_api.list_namespaced_custom_object(
-                group="agent.kagenti.dev",
-                version="v1alpha1",
-                namespace=namespace,
-                plural="agentcards"
-            )
+    # Shield the shared request so one caller giving up doesn't cancel it
+    # for everyone else waiting on it
+    return await asyncio.shield(task)
+
+
+async def _list_agent_cards(
+    namespace: Optional[str] = None
+) -> List[Dict[str, Any]]:
+    """
+    List AgentCard resources from the Kubernetes API.
+
+    Args:
+        namespace: Specific namespace to search, or None for all namespaces
+
+    Returns:
+        List of AgentCard CRD objects as dictionaries
+    """
+    try:
+        async with _get_k8s_client() as custom_api:
+            # Call the appropriate API method based on namespace scope
+            if namespace is None:
+                # List across all namespaces
+                result = await custom_api.list_cluster_custom_object(
+                    group="agent.kagenti.dev",
+                    version="v1alpha1",
+                    plural="agentcards"
+                )
+            else:
+                # List in specific namespace
+                result = await custom_api.list_namespaced_custom_object(
+                    group="agent.kagenti.dev",
+                    version="v1alpha1",
+                    namespace=namespace,
+                    plural="agentcards"
+                )
 
         return result.get("items", [])
 
@@ -98,10 +144,214 @@ def discover_agent_cards(
         raise Exception(f"Failed to discover agent cards: {e}")
 
 
-def get_agents_data(
+@dataclass(slots=True)
+class AgentInfo:
+    """Summary of an agent taken from its AgentCard CR."""
+
+    agentcard_name: str
+    namespace: str
+    agent_name: str = ""
+    description: str = ""
+    version: str = ""
+    url: str = ""
+    protocol: str = "unknown"
+    capabilities: Dict[str, Any] = field(default_factory=dict)
+    skills: List[Dict[str, Any]] = field(default_factory=list)
+    supports_authenticated_extended_card: bool = False
+    sync_status: str = "Unknown"
+    sync_message: str = ""
+    last_sync_time: str = ""
+    # Skill names and descriptions flattened once per card
+    skill_names: tuple[str, ...] = field(init=False, repr=False, compare=False)
+    skill_descs: tuple[str, ...] = field(init=False, repr=False, compare=False)
+    # Lowercase text searched by list_agents filters, built once per card
+    haystack: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.skill_names = tuple(skill.get("name", "") for skill in self.skills)
+        self.skill_descs = tuple(
+            skill.get("description", "") for skill in self.skills
+        )
+        self.haystack = _build_haystack(self)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the public fields as a JSON-ready dictionary."""
+        return {name: getattr(self, name) for name in _AGENT_INFO_FIELDS}
+
+
+def _build_haystack(agent: AgentInfo) -> str:
+    """
+    Build the lowercase text searched by list_agents filters.
+
+    Fields are joined with newlines so a filter cannot match across the
+    boundary between two fields.
+
+    Args:
+        agent: Agent information
+
+    Returns:
+        Agent name, description and skill names/descriptions, lowercased
+    """
+    parts = [agent.agent_name or "", agent.description or ""]
+    for name, desc in zip(agent.skill_names, agent.skill_descs):
+        parts.append(name or "")
+        parts.append(desc or "")
+    return "\n".join(parts).lower()
+
+
+# Fields derived in __post_init__ are internal and left out of to_dict()
+_AGENT_INFO_FIELDS = tuple(f.name for f in fields(AgentInfo) if f.init)
+
+
+def _filter_agents(agents: List[AgentInfo], needle: str) -> List[AgentInfo]:
+    """
+    Return the agents whose haystack contains needle.
+
+    Args:
+        agents: Agents to filter
+        needle: Lowercase filter text
+
+    Returns:
+        Matching agents, in listing order
+    """
+    return [agent for agent in agents if needle in agent.haystack]
+
+
+# Operators recognised in list_agents filters. Only the uppercase spelling is
+# an operator, so lowercase "and"/"or"/"not" still match as plain text.
+_FILTER_KEYWORDS = frozenset({"AND", "OR", "NOT"})
+
+
+@lru_cache(maxsize=128)
+def _compile_filter(expr: str) -> Optional[Callable[[str], bool]]:
+    """
+    Compile a boolean filter expression into a predicate over haystacks.
+
+    Terms are case-insensitive substrings; adjacent words form one phrase.
+    NOT binds tighter than AND, which binds tighter than OR, e.g.
+    "weather AND NOT sql OR time" means "(weather AND (NOT sql)) OR time".
+
+    Args:
+        expr: Filter text as passed to list_agents
+
+    Returns:
+        Predicate taking an agent haystack, or None if expr contains no
+        operators and should be matched as a single substring
+
+    Raises:
+        ValueError: If an operator is missing an operand
+    """
+    tokens = expr.split()
+    if _FILTER_KEYWORDS.isdisjoint(tokens):
+        return None
+
+    pos = 0
+    # Phrase predicate -> its phrase, so an OR of plain phrases can be fused
+    phrases: Dict[Callable[[str], bool], str] = {}
+
+    def parse_or() -> Callable[[str], bool]:
+        nonlocal pos
+        terms = [parse_and()]
+        while pos < len(tokens) and tokens[pos] == "OR":
+            pos += 1
+            terms.append(parse_and())
+        if len(terms) == 1:
+            return terms[0]
+        if all(term in phrases for term in terms):
+            # Test the substrings directly rather than calling each predicate
+            alternatives = tuple(phrases[term] for term in terms)
+            return lambda haystack: any(p in haystack for p in alternatives)
+        return lambda haystack: any(term(haystack) for term in terms)
+
+    def parse_and() -> Callable[[str], bool]:
+        nonlocal pos
+        terms = [parse_not()]
+        while pos < len(tokens) and tokens[pos] == "AND":
+            pos += 1
+            terms.append(parse_not())
+        if len(terms) == 1:
+            return terms[0]
+        return lambda haystack: all(term(haystack) for term in terms)
+
+    def parse_not() -> Callable[[str], bool]:
+        nonlocal pos
+        if pos < len(tokens) and tokens[pos] == "NOT":
+            pos += 1
+            term = parse_not()
+            return lambda haystack: not term(haystack)
+
+        words = []
+        while pos < len(tokens) and tokens[pos] not in _FILTER_KEYWORDS:
+            words.append(tokens[pos])
+            pos += 1
+        if not words:
+            raise ValueError(f"Invalid filter expression: '{expr}'")
+        phrase = " ".join(words).lower()
+
+        def predicate(haystack: str) -> bool:
+            return phrase in haystack
+
+        phrases[predicate] = phrase
+        return predicate
+
+    predicate = parse_or()
+    if pos != len(tokens):
+        raise ValueError(f"Invalid filter expression: '{expr}'")
+    return predicate
+
+
+def _parse_card_cr(card_cr: Dict[str, Any]) -> AgentInfo:
+    """
+    Extract the agent summary from a single AgentCard CR.
+
+    Args:
+        card_cr: AgentCard CRD object as a dictionary
+
+    Returns:
+        Agent information
+    """
+    metadata = card_cr.get("metadata", {})
+    status = card_cr.get("status", {})
+
+    # Extract basic metadata
+    card_name = metadata.get("name", "unknown")
+    card_namespace = metadata.get("namespace", "")
+
+    # Get cached agent card data from status
+    card_data = status.get("card", {})
+
+    # Get sync status
+    conditions = {c.get("type"): c for c in status.get("conditions", [])}
+    synced_condition = conditions.get("Synced", {})
+    sync_status = synced_condition.get("status", "Unknown")
+    sync_message = synced_condition.get("message", "")
+
+    last_sync_time = status.get("lastSyncTime", "")
+    protocol = status.get("protocol", "unknown")
+
+    return AgentInfo(
+        agentcard_name=card_name,
+        namespace=card_namespace,
+        agent_name=card_data.get("name", ""),
+        description=card_data.get("description", ""),
+        version=card_data.get("version", ""),
+        url=card_data.get("url", ""),
+        protocol=protocol,
+        capabilities=card_data.get("capabilities", {}),
+        skills=card_data.get("skills", []),
+        supports_authenticated_extended_card=card_data.get(
+            "supportsAuthenticatedExtendedCard", False
+        ),
+        sync_status=sync_status,
+        sync_message=sync_message,
+        last_sync_time=last_sync_time,
+    )
+
+
+async def get_agents_data(
     namespace: Optional[str] = None,
     all_namespaces: bool = False,
-) -> tuple[List[Dict[str, Any]], str]:
+) -> tuple[List[AgentInfo], str]:
     """
     Get agent data without formatting.
 
@@ -115,60 +365,39 @@ def get_agents_data(
     # Get namespace scope
     namespace_value, scope_msg = get_namespace_scope(namespace, all_namespaces)
 
-    # Discover AgentCard CRs
-    agent_card_crs = discover_agent_cards(namespace_value)
+    # Results are visible per caller, so the token is part of the key
+    cache_key = (namespace_value, auth.current_token_hash())
+    cached = _agents_cache.get(cache_key)
+    if cached and cached[0] > time.monotonic():
+        return cached[1], scope_msg
 
-    if not agent_card_crs:
-        return [], scope_msg
+    # Discover AgentCard CRs
+    try:
+        agent_card_crs = await discover_agent_cards(namespace_value)
+    except Exception:
+        _agents_cache.pop(cache_key, None)
+        raise
 
     # Process discovered AgentCard CRs
-    agents = []
-    for card_cr in agent_card_crs:
-        metadata = card_cr.get("metadata", {})
-        status = card_cr.get("status", {})
-
-        # Extract basic metadata
-        card_name = metadata.get("name", "unknown")
-        card_namespace = metadata.get("namespace", "")
-
-        # Get cached agent card data from status
-        card_data = status.get("card", {})
-
-        # Get sync status
-        conditions = status.get("conditions", [])
-        synced_condition = next(
-            (c for c in conditions if c.get("type") == "Synced"), {}
-        )
-        sync_status = synced_condition.get("status", "Unknown")
-        sync_message = synced_condition.get("message", "")
-
-        last_sync_time = status.get("lastSyncTime", "")
-        protocol = status.get("protocol", "unknown")
-
-        agent_info = {
-            "agentcard_name": card_name,
-            "namespace": card_namespace,
-            "agent_name": card_data.get("name", ""),
-            "description": card_data.get("description", ""),
-            "version": card_data.get("version", ""),
-            "url": card_data.get("url", ""),
-            "protocol": protocol,
-            "capabilities": card_data.get("capabilities", {}),
-            "skills": card_data.get("skills", []),
-            "supports_authenticated_extended_card": card_data.get(
-                "supportsAuthenticatedExtendedCard", False
-            ),
-            "sync_status": sync_status,
-            "sync_message": sync_message,
-            "last_sync_time": last_sync_time,
-        }
-
-        agents.append(agent_info)
+    agents = list(map(_parse_card_cr, agent_card_crs))
+
+    if AGENTS_CACHE_TTL > 0:
+        now = time.monotonic()
+        # Drop expired entries so callers that stop calling don't pile up
+        expired = [k for k, (expires_at, _) in _agents_cache.items() if expires_at <= now]
+        for key in expired:
+            del _agents_cache[key]
+        _agents_cache[cache_key] = (now + AGENTS_CACHE_TTL, agents)
 
     return agents, scope_msg
 
 
-def discover_agents(
+def clear_agents_cache() -> None:
+    """Forget every cached agent listing, forcing the next call to the API."""
+    _agents_cache.clear()
+
+
+async def discover_agents(
     namespace: Optional[str] = None,
     all_namespaces: bool = False,
 ) -> str:
@@ -186,7 +415,7 @@ def discover_agents(
     Returns:
         JSON array of discovered agents with their cached metadata
     """
-    agents, scope_msg = get_agents_data(namespace, all_namespaces)
+    agents, scope_msg = await get_agents_data(namespace, all_namespaces)
 
     if not agents:
         return (
@@ -195,13 +424,13 @@ def discover_agents(
             "Agents are deployed with the kagenti.io/type=agent label."
         )
 
-    result_text = f"Found {len(agents)} agent(s) in {scope_msg}:\n\n"
-    result_text += json.dumps(agents, indent=2)
+    public_agents = [agent.to_dict() for agent in agents]
 
-    return result_text
+    body = jsonutil.dumps(public_agents)
+    return f"Found {len(agents)} agent(s) in {scope_msg}:\n\n{body}"
 
 
-def list_agents(
+async def list_agents(
     namespace: Optional[str] = None,
     all_namespaces: bool = False,
     filter: Optional[str] = None,
@@ -217,12 +446,13 @@ def list_agents(
         all_namespaces: Search across all namespaces (default: False)
         filter: Optional case-insensitive substring to filter agents by.
                Searches across agent name, description, and skill names/descriptions.
+               Terms may be combined with uppercase AND, OR and NOT.
 
     Returns:
         Formatted table of agent information
     """
     try:
-        agents, scope_msg = get_agents_data(namespace, all_namespaces)
+        agents, scope_msg = await get_agents_data(namespace, all_namespaces)
 
         if not agents:
             return (
@@ -233,60 +463,48 @@ def list_agents(
 
         # Apply filter if provided
         if filter:
-            filter_lower = filter.lower()
-            filtered_agents = []
-
-            for agent in agents:
-                # Search in agent name
-                if filter_lower in (agent["agent_name"] or "").lower():
-                    filtered_agents.append(agent)
-                    continue
-
-                # Search in description
-                if filter_lower in (agent["description"] or "").lower():
-                    filtered_agents.append(agent)
-                    continue
-
-                # Search in skills
-                for skill in agent.get("skills", []):
-                    skill_name = skill.get("name", "").lower()
-                    skill_desc = skill.get("description", "").lower()
-                    if filter_lower in skill_name or filter_lower in skill_desc:
-                        filtered_agents.append(agent)
-                        break
-
-            agents = filtered_agents
+            predicate = _compile_filter(filter)
+            if predicate is None:
+                agents = _filter_agents(agents, filter.lower())
+            else:
+                agents = [agent for agent in agents if predicate(agent.haystack)]
 
             if not agents:
                 return f"No agents matching filter '{filter}' found in {scope_msg}."
 
         # Create summary table
-        summary = "Agent Summary:\n\n"
+        parts = ["Agent Summary:\n\n"]
         if filter:
-            summary += f"Filter: '{filter}'\n\n"
+            parts.append(f"Filter: '{filter}'\n\n")
 
-        summary += f"{'AGENT NAME':<25} {'VERSION':<12} {'PROTOCOL':<10} {'SYNCED':<8} {'NAMESPACE':<20} {'URL':<50}\n"
-        summary += f"{'-'*25} {'-'*12} {'-'*10} {'-'*8} {'-'*20} {'-'*50}\n"
+        parts.append(_ROW_FMT.format(
+            "AGENT NAME", "VERSION", "PROTOCOL", "SYNCED", "NAMESPACE", "URL"
+        ))
+        parts.append(_ROW_FMT.format(
+            "-" * 25, "-" * 12, "-" * 10, "-" * 8, "-" * 20, "-" * 50
+        ))
 
         for agent in agents:
-            agent_name = agent["agent_name"] or agent["agentcard_name"]
-            version = agent["version"] or "N/A"
-            protocol = agent["protocol"]
-            synced = "Yes" if agent["sync_status"] == "True" else "No"
-            agent_namespace = agent["namespace"]
-            url = agent["url"] or "N/A"
+            agent_name = agent.agent_name or agent.agentcard_name
+            version = agent.version or "N/A"
+            protocol = agent.protocol
+            synced = "Yes" if agent.sync_status == "True" else "No"
+            agent_namespace = agent.namespace
+            url = agent.url or "N/A"
 
-            summary += f"{agent_name:<25} {version:<12} {protocol:<10} {synced:<8} {agent_namespace:<20} {url:<50}\n"
+            parts.append(_ROW_FMT.format(
+                agent_name, version, protocol, synced, agent_namespace, url
+            ))
 
-        summary += f"\nTotal: {len(agents)} agent(s)"
+        parts.append(f"\nTotal: {len(agents)} agent(s)")
 
-        return summary
+        return "".join(parts)
 
     except Exception as e:
         raise Exception(f"Error creating agent summary: {e}")
 
 
-def get_agent_details(
+async def get_agent_details(
     agentcard_name: str,
     namespace: str,
 ) -> str:
@@ -301,16 +519,15 @@ def get_agent_details(
         Detailed JSON information about the agent and its capabilities
     """
     try:
-        custom_api = _get_k8s_client()
-
-        # Get the specific AgentCard
-        card_cr = custom_api.get_namespaced_custom_object(
-            group="agent.kagenti.dev",
-            version="v1alpha1",
-            namespace=namespace,
-            plural="agentcards",
-            name=agentcard_name
-        )
+        async with _get_k8s_client() as custom_api:
+            # Get the specific AgentCard
+            card_cr = await custom_api.get_namespaced_custom_object(
+                group="agent.kagenti.dev",
+                version="v1alpha1",
+                namespace=namespace,
+                plural="agentcards",
+                name=agentcard_name
+            )
 
         card_data = card_cr.get("status", {}).get("card", {})
 
@@ -320,10 +537,8 @@ def get_agent_details(
                 "The agent may not be ready or the sync may have failed."
             )
 
-        result_text = f"Agent details for {agentcard_name}:\n\n"
-        result_text += json.dumps(card_data, indent=2)
-
-        return result_text
+        body = jsonutil.dumps(card_data)
+        return f"Agent details for {agentcard_name}:\n\n{body}"
 
     except ApiException as e:
         if e.status == 404:
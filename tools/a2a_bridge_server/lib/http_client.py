@@ -0,0 +1,70 @@
+"""Shared HTTP client used for all outbound A2A traffic."""
+
+import os
+import ssl
+import httpx
+from typing import Optional
+
+
+# Connection pool sizing for the shared client. Keep-alive connections are
+# held for a few minutes so repeated messages to the same agent skip the
+# TCP/TLS handshake.
+HTTP_LIMITS = httpx.Limits(
+    max_keepalive_connections=20,
+    max_connections=100,
+    keepalive_expiry=300,
+)
+HTTP_TIMEOUT = 30
+
+
+def _build_ssl_context() -> ssl.SSLContext | bool:
+    """
+    Build the TLS configuration shared by every outbound connection.
+
+    A2A_CA_BUNDLE adds a CA file to the system trust store. A2A_INSECURE=1
+    disables certificate verification for development clusters.
+
+    Returns:
+        SSL context to verify with, or False when verification is disabled
+    """
+    if os.getenv("A2A_INSECURE") == "1":
+        return False
+
+    context = ssl.create_default_context()
+    ca_bundle = os.getenv("A2A_CA_BUNDLE")
+    if ca_bundle:
+        context.load_verify_locations(cafile=ca_bundle)
+    return context
+
+
+# Built once so every client shares one context and its TLS session cache
+SSL_CONTEXT = _build_ssl_context()
+
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Get the shared httpx client, creating it on first use.
+
+    Returns:
+        Process-wide httpx.AsyncClient with a pooled connection set
+    """
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            verify=SSL_CONTEXT,
+            # Concurrent streams to the same agent share one connection
+            http2=True,
+            timeout=HTTP_TIMEOUT,
+            limits=HTTP_LIMITS,
+        )
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Close the shared httpx client, if one was created."""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
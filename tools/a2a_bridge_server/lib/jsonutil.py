@@ -0,0 +1,48 @@
+"""JSON serialization helpers, using orjson when it is installed."""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    # orjson is an optional speedup; fall back to the standard library
+    orjson = None
+
+
+def dumps(obj: Any, pretty: bool = True) -> str:
+    """
+    Serialize an object to a JSON string.
+
+    Args:
+        obj: JSON-compatible object to serialize
+        pretty: Indent the output with two spaces (default: True)
+
+    Returns:
+        JSON text
+    """
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if pretty else 0
+        return orjson.dumps(obj, option=option).decode()
+    if pretty:
+        return json.dumps(obj, indent=2)
+    return json.dumps(obj, separators=(",", ":"))
+
+
+def loads(data: str | bytes) -> Any:
+    """
+    Parse JSON text.
+
+    Args:
+        data: JSON text
+
+    Returns:
+        The decoded object
+
+    Raises:
+        json.JSONDecodeError: If data is not valid JSON
+    """
+    if orjson is not None:
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError
+        return orjson.loads(data)
+    return json.loads(data)
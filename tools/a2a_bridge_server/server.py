@@ -13,13 +13,14 @@ This server is intended to recieve a jwt token for authorization to the kubernet
 The server uses the JWT to call Kubernetes API, enforcing user-level RBAC.
 """
 
+from contextlib import asynccontextmanager
 from typing import Optional
-from fastmcp import FastMCP
+from fastmcp import Context, FastMCP
 from starlette.middleware import Middleware
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.requests import Request
 
-from lib import discovery, a2a, auth
+from lib import discovery, a2a, auth, http_client
 
 
 # Create the MCP server
@@ -54,7 +55,7 @@ AUTH_MIDDLEWARE = [Middleware(AuthHeaderMiddleware)]
 
 
 @mcp.tool()
-def discover_agents(
+async def discover_agents(
     namespace: Optional[str] = None,
     all_namespaces: bool = False,
 ) -> str:
@@ -72,11 +73,11 @@ def discover_agents(
     Returns:
         JSON array of discovered agents with their cached metadata
     """
-    return discovery.discover_agents(namespace, all_namespaces)
+    return await discovery.discover_agents(namespace, all_namespaces)
 
 
 @mcp.tool()
-def list_agents(
+async def list_agents(
     namespace: Optional[str] = None,
     all_namespaces: bool = False,
     filter: Optional[str] = None,
@@ -92,15 +93,16 @@ def list_agents(
         all_namespaces: Search across all namespaces (default: False)
         filter: Case-insensitive substring to filter agents by skill, name, or description.
                Example: filter="weather" finds agents with "weather" in their skills.
+               Terms can be combined with AND, OR and NOT, e.g. "sql OR weather".
 
     Returns:
         Formatted table of agent information
     """
-    return discovery.list_agents(namespace, all_namespaces, filter=filter)
+    return await discovery.list_agents(namespace, all_namespaces, filter=filter)
 
 
 @mcp.tool()
-def get_agent_details(
+async def get_agent_details(
     agentcard_name: str,
     namespace: str,
 ) -> str:
@@ -114,7 +116,7 @@ def get_agent_details(
     Returns:
         Detailed JSON information about the agent and its capabilities
     """
-    return discovery.get_agent_details(agentcard_name, namespace)
+    return await discovery.get_agent_details(agentcard_name, namespace)
 
 
 @mcp.tool()
@@ -134,29 +136,42 @@ async def send_message_to_agent(
     Returns:
         JSON response from the agent
     """
-    return await a2a.send_message_to_agent(agent_url, message, use_extended_card)
+    return await a2a.send_message_to_agent(
+        agent_url, message, use_extended_card=use_extended_card
+    )
 
 
 @mcp.tool()
 async def send_streaming_message_to_agent(
     agent_url: str,
     message: str,
+    ctx: Context,
     use_extended_card: bool = False,
+    pretty: bool = False,
 ) -> str:
     """
     Send a streaming message to an A2A agent and get the streaming response.
 
+    Each chunk is forwarded to the client as a progress notification as soon
+    as it arrives, so clients that track progress can render it incrementally.
+
     Args:
         agent_url: The base URL of the agent (from AgentCard status.card.url)
         message: The message text to send
         use_extended_card: Whether to attempt fetching the extended agent card
+        pretty: Indent each chunk for readability (default: compact JSON)
 
     Returns:
         All streaming response chunks from the agent as JSON
     """
-    return await a2a.send_streaming_message_to_agent(
-        agent_url, message, use_extended_card
-    )
+    parts = [f"Streaming response from {agent_url}:"]
+    async for chunk in a2a.send_streaming_message_to_agent(
+        agent_url, message, use_extended_card=use_extended_card, pretty=pretty
+    ):
+        parts.append(chunk)
+        await ctx.report_progress(progress=len(parts) - 1, message=chunk)
+
+    return "\n\n".join(parts)
 
 
 def main():
@@ -172,6 +187,21 @@ def main():
     # Create HTTP app with custom middleware
     app = mcp.http_app(middleware=AUTH_MIDDLEWARE)
 
+    # Wrap the MCP lifespan so shared HTTP and Kubernetes clients are
+    # closed on shutdown
+    mcp_lifespan = app.router.lifespan_context
+
+    @asynccontextmanager
+    async def lifespan(app):
+        async with mcp_lifespan(app):
+            try:
+                yield
+            finally:
+                await http_client.close_http_client()
+                await auth.close_async_k8s_clients()
+
+    app.router.lifespan_context = lifespan
+
     # Add health check routes
     app.routes.append(Route("/health", health))
     app.routes.append(Route("/healthz", health))
@@ -0,0 +1,71 @@
+"""Test caching of agent listings."""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from lib import discovery
+
+
+@patch('lib.discovery.discover_agent_cards')
+def test_agents_data_is_cached_between_calls(mock_discover_agent_cards):
+    """Test that repeated listings within the TTL reuse the first result."""
+    mock_discover_agent_cards.return_value = [
+        {"metadata": {"name": "weather-agent-card", "namespace": "kagenti"},
+         "status": {"card": {"name": "Weather Assistant"}}}
+    ]
+    discovery.clear_agents_cache()
+
+    try:
+        first, _ = asyncio.run(discovery.get_agents_data(namespace="kagenti"))
+        second, _ = asyncio.run(discovery.get_agents_data(namespace="kagenti"))
+    finally:
+        discovery.clear_agents_cache()
+
+    assert first is second
+    assert mock_discover_agent_cards.await_count == 1
+
+
+def test_concurrent_listings_share_one_request():
+    """Test that concurrent listings for the same key make one API call."""
+    async def slow_list(namespace):
+        await asyncio.sleep(0.01)
+        return [{"metadata": {"name": "weather-agent-card"}}]
+
+    async def scenario():
+        return await asyncio.gather(
+            discovery.discover_agent_cards("kagenti"),
+            discovery.discover_agent_cards("kagenti"),
+        )
+
+    with patch.object(discovery, '_list_agent_cards', AsyncMock(side_effect=slow_list)) as mock_list:
+        first, second = asyncio.run(scenario())
+
+    assert first is second
+    assert mock_list.await_count == 1
+    assert discovery._in_flight == {}
+
+
+def test_failed_listing_reaches_every_caller():
+    """Test that a shared request's error is raised to all waiting callers."""
+    async def failing_list(namespace):
+        await asyncio.sleep(0.01)
+        raise RuntimeError("API unavailable")
+
+    async def scenario():
+        return await asyncio.gather(
+            discovery.discover_agent_cards("kagenti"),
+            discovery.discover_agent_cards("kagenti"),
+            return_exceptions=True,
+        )
+
+    with patch.object(discovery, '_list_agent_cards', AsyncMock(side_effect=failing_list)) as mock_list:
+        results = asyncio.run(scenario())
+
+    assert [str(result) for result in results] == ["API unavailable"] * 2
+    assert mock_list.await_count == 1
+    assert discovery._in_flight == {}
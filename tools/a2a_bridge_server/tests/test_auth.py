@@ -0,0 +1,42 @@
+"""Test caching of async Kubernetes API clients."""
+
+import asyncio
+from unittest.mock import patch
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from lib import auth
+
+
+@patch.object(auth, 'ASYNC_CLIENT_CACHE_SIZE', 1)
+@patch.object(auth, '_cluster_settings', return_value=("https://k8s.example", None, True))
+def test_evicted_client_is_closed_after_last_use(_mock_cluster_settings):
+    """Test that a client evicted mid-request stays open until it is released."""
+    async def scenario():
+        auth.set_auth_context("token-a")
+        async with auth.async_k8s_client() as first:
+            # Caching a second token evicts the first client while it is in use
+            await auth.create_async_k8s_client_from_token("token-b")
+            assert not first.rest_client.pool_manager.closed
+
+        assert first.rest_client.pool_manager.closed
+        await auth.close_async_k8s_clients()
+
+    asyncio.run(scenario())
+
+
+@patch.object(auth, 'ASYNC_CLIENT_CACHE_SIZE', 1)
+@patch.object(auth, '_cluster_settings', return_value=("https://k8s.example", None, True))
+def test_idle_evicted_client_is_closed_immediately(_mock_cluster_settings):
+    """Test that a client nobody is using is closed as soon as it is evicted."""
+    async def scenario():
+        first = await auth.create_async_k8s_client_from_token("token-a")
+        await auth.create_async_k8s_client_from_token("token-b")
+
+        assert first.rest_client.pool_manager.closed
+        await auth.close_async_k8s_clients()
+
+    asyncio.run(scenario())
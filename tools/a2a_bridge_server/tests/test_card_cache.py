@@ -0,0 +1,109 @@
+"""Test caching of agent cards and A2A clients."""
+
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, patch
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from a2a.types import AgentCapabilities, AgentCard
+from lib import a2a
+
+
+def _card(url="http://agent.example"):
+    return AgentCard(
+        name="Test Agent",
+        description="Agent used in tests",
+        url=url,
+        version="1.0.0",
+        capabilities=AgentCapabilities(),
+        default_input_modes=["text"],
+        default_output_modes=["text"],
+        skills=[],
+    )
+
+
+@pytest.fixture(autouse=True)
+def empty_caches():
+    """Start and end every test with empty card and client caches."""
+    a2a._card_cache.clear()
+    a2a._client_cache.clear()
+    yield
+    a2a._card_cache.clear()
+    a2a._client_cache.clear()
+
+
+def test_concurrent_misses_share_one_fetch():
+    """Test that concurrent lookups for the same key fetch the card once."""
+    card = _card()
+
+    async def slow_fetch():
+        await asyncio.sleep(0.01)
+        return card, True
+
+    fetch = AsyncMock(side_effect=slow_fetch)
+    key = a2a._card_key(card.url, None, False)
+
+    async def scenario():
+        return await asyncio.gather(
+            a2a._get_cached_card(key, fetch),
+            a2a._get_cached_card(key, fetch),
+        )
+
+    assert asyncio.run(scenario()) == [card, card]
+    assert fetch.await_count == 1
+    assert a2a._card_fetches == {}
+
+
+def test_failed_fetch_is_not_cached():
+    """Test that a failed fetch reaches the caller and leaves nothing behind."""
+    fetch = AsyncMock(side_effect=RuntimeError("agent unreachable"))
+    key = a2a._card_key("http://agent.example", None, False)
+
+    with pytest.raises(RuntimeError, match="agent unreachable"):
+        asyncio.run(a2a._get_cached_card(key, fetch))
+
+    assert key not in a2a._card_cache
+    assert a2a._card_fetches == {}
+
+
+def test_expired_entries_are_pruned_on_write():
+    """Test that storing a card drops expired cards and their clients."""
+    stale_key = a2a._card_key("http://stale.example", None, False)
+    a2a._card_cache[stale_key] = (0.0, _card("http://stale.example"))
+    a2a._client_cache[stale_key] = (None, None, None)
+
+    card = _card()
+    key = a2a._card_key(card.url, None, False)
+    asyncio.run(a2a._get_cached_card(key, AsyncMock(return_value=(card, True))))
+
+    assert list(a2a._card_cache) == [key]
+    assert stale_key not in a2a._client_cache
+
+
+def test_fallback_card_is_not_cached():
+    """Test that a public card standing in for a failed extended card is not reused."""
+    card = _card()
+    fetch = AsyncMock(return_value=(card, False))
+    key = a2a._card_key(card.url, "token", True)
+
+    assert asyncio.run(a2a._get_cached_card(key, fetch)) is card
+    asyncio.run(a2a._get_cached_card(key, fetch))
+
+    assert key not in a2a._card_cache
+    assert fetch.await_count == 2
+
+
+def test_client_is_reused_for_the_same_card():
+    """Test that the A2A client is rebuilt only when the card changes."""
+    card = _card()
+    key = a2a._card_key(card.url, None, False)
+    a2a._card_cache[key] = (float("inf"), card)
+
+    with patch.object(a2a, 'get_http_client', return_value=object()):
+        first = a2a._get_client(key, card)
+        assert a2a._get_client(key, card) is first
+        assert a2a._get_client(key, _card()) is not first
@@ -0,0 +1,95 @@
+"""Test batching of streamed chunks."""
+
+import asyncio
+import pytest
+from unittest.mock import patch
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from lib import a2a
+
+
+async def _drip(chunks, interval):
+    for chunk in chunks:
+        await asyncio.sleep(interval)
+        yield chunk
+
+
+async def _collect(chunks):
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    batches = []
+    async for batch in a2a._coalesce_chunks(chunks):
+        batches.append((loop.time() - start, batch))
+    return batches
+
+
+@patch.object(a2a, 'CHUNK_FLUSH_MS', 50)
+def test_fast_small_chunks_are_flushed_within_interval():
+    """Test that chunks arriving faster than the interval are not held back."""
+    chunks = [f"chunk-{i:03}" for i in range(20)]
+
+    batches = asyncio.run(_collect(_drip(chunks, 0.03)))
+
+    # The first chunk arrives at ~30ms and must go out by ~80ms
+    assert batches[0][0] < 0.2
+    assert len(batches) > 1
+    assert a2a.CHUNK_SEPARATOR.join(batch for _, batch in batches) == (
+        a2a.CHUNK_SEPARATOR.join(chunks)
+    )
+
+
+@patch.object(a2a, 'CHUNK_BUFFER_BYTES', 10)
+@patch.object(a2a, 'CHUNK_FLUSH_MS', 10_000)
+def test_buffer_size_counts_utf8_bytes():
+    """Test that the size limit is measured in encoded bytes."""
+    async def chunks():
+        yield "ééé"
+        # Four characters, but twelve bytes once encoded
+        yield "日本語だ"
+        await asyncio.sleep(1)
+        yield "end"
+
+    batches = asyncio.run(_collect(chunks()))
+
+    assert [batch for _, batch in batches] == [
+        "ééé" + a2a.CHUNK_SEPARATOR + "日本語だ",
+        "end",
+    ]
+    assert batches[0][0] < 0.5
+
+
+def test_upstream_error_reaches_consumer():
+    """Test that an error raised by the upstream stream is re-raised."""
+    async def failing():
+        yield "first"
+        raise RuntimeError("stream broke")
+
+    with pytest.raises(RuntimeError, match="stream broke"):
+        asyncio.run(_collect(failing()))
+
+
+def test_early_exit_closes_upstream():
+    """Test that a consumer leaving early stops the producer and closes the source."""
+    closed = asyncio.Event()
+
+    async def endless():
+        try:
+            while True:
+                await asyncio.sleep(0)
+                yield "chunk"
+        finally:
+            closed.set()
+
+    async def scenario():
+        batches = a2a._coalesce_chunks(endless())
+        async for _ in batches:
+            break
+        await batches.aclose()
+        assert closed.is_set()
+        assert len(asyncio.all_tasks()) == 1
+
+    asyncio.run(scenario())
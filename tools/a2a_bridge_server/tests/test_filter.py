@@ -1,5 +1,6 @@
 """Test agent filtering logic."""
 
+import asyncio
 import pytest
 from unittest.mock import patch
 
@@ -12,7 +13,7 @@ from lib import discovery
 
 
 # Sample agent data for testing
-SAMPLE_AGENTS = [
+SAMPLE_AGENTS = tuple(discovery.AgentInfo(**agent) for agent in [
     {
         "agentcard_name": "weather-agent-card",
         "namespace": "kagenti",
@@ -65,15 +66,22 @@ SAMPLE_AGENTS = [
         "sync_message": "OK",
         "last_sync_time": "2025-10-29T10:00:00Z"
     }
-]
+])
 
 
-@patch('lib.discovery.get_agents_data')
-def test_no_filter_returns_all_agents(mock_get_agents_data):
-    """Test that without a filter, all agents are returned."""
-    mock_get_agents_data.return_value = (SAMPLE_AGENTS, "namespace: kagenti")
+@pytest.fixture(scope="module")
+def mocked_discovery():
+    """Patch get_agents_data to return SAMPLE_AGENTS for the whole module."""
+    with patch(
+        'lib.discovery.get_agents_data',
+        return_value=(SAMPLE_AGENTS, "namespace: kagenti"),
+    ) as mock_get_agents_data:
+        yield mock_get_agents_data
+
 
-    result = discovery.list_agents(namespace="kagenti")
+def test_no_filter_returns_all_agents(mocked_discovery):
+    """Test that without a filter, all agents are returned."""
+    result = asyncio.run(discovery.list_agents(namespace="kagenti"))
 
     # All three agents should appear in the output
     assert "Weather Assistant" in result
@@ -82,13 +90,10 @@ def test_no_filter_returns_all_agents(mock_get_agents_data):
     assert "Total: 3 agent(s)" in result
 
 
-@patch('lib.discovery.get_agents_data')
-def test_filter_returns_only_matches(mock_get_agents_data):
+def test_filter_returns_only_matches(mocked_discovery):
     """Test that filter returns only matching agents."""
-    mock_get_agents_data.return_value = (SAMPLE_AGENTS, "namespace: kagenti")
-
     # Filter for "weather"
-    result = discovery.list_agents(namespace="kagenti", filter="weather")
+    result = asyncio.run(discovery.list_agents(namespace="kagenti", filter="weather"))
 
     # Only weather agent should appear
     assert "Weather Assistant" in result
@@ -98,15 +103,12 @@ def test_filter_returns_only_matches(mock_get_agents_data):
     assert "Filter: 'weather'" in result
 
 
-@patch('lib.discovery.get_agents_data')
-def test_filter_is_case_insensitive(mock_get_agents_data):
+def test_filter_is_case_insensitive(mocked_discovery):
     """Test that filter is case-insensitive."""
-    mock_get_agents_data.return_value = (SAMPLE_AGENTS, "namespace: kagenti")
-
     # Filter with different cases
-    result1 = discovery.list_agents(namespace="kagenti", filter="WEATHER")
-    result2 = discovery.list_agents(namespace="kagenti", filter="Weather")
-    result3 = discovery.list_agents(namespace="kagenti", filter="weather")
+    result1 = asyncio.run(discovery.list_agents(namespace="kagenti", filter="WEATHER"))
+    result2 = asyncio.run(discovery.list_agents(namespace="kagenti", filter="Weather"))
+    result3 = asyncio.run(discovery.list_agents(namespace="kagenti", filter="weather"))
 
     # All should match the weather agent
     assert "Weather Assistant" in result1
@@ -114,56 +116,41 @@ def test_filter_is_case_insensitive(mock_get_agents_data):
     assert "Weather Assistant" in result3
 
 
-@patch('lib.discovery.get_agents_data')
-def test_filter_searches_agent_name(mock_get_agents_data):
+def test_filter_searches_agent_name(mocked_discovery):
     """Test that filter searches in agent name."""
-    mock_get_agents_data.return_value = (SAMPLE_AGENTS, "namespace: kagenti")
-
-    result = discovery.list_agents(namespace="kagenti", filter="database")
+    result = asyncio.run(discovery.list_agents(namespace="kagenti", filter="database"))
 
     assert "Database Assistant" in result
     assert "Total: 1 agent(s)" in result
 
 
-@patch('lib.discovery.get_agents_data')
-def test_filter_searches_description(mock_get_agents_data):
+def test_filter_searches_description(mocked_discovery):
     """Test that filter searches in description."""
-    mock_get_agents_data.return_value = (SAMPLE_AGENTS, "namespace: kagenti")
-
-    result = discovery.list_agents(namespace="kagenti", filter="conversation")
+    result = asyncio.run(discovery.list_agents(namespace="kagenti", filter="conversation"))
 
     assert "Chat Bot" in result
     assert "Total: 1 agent(s)" in result
 
 
-@patch('lib.discovery.get_agents_data')
-def test_filter_searches_skill_names(mock_get_agents_data):
+def test_filter_searches_skill_names(mocked_discovery):
     """Test that filter searches in skill names."""
-    mock_get_agents_data.return_value = (SAMPLE_AGENTS, "namespace: kagenti")
-
-    result = discovery.list_agents(namespace="kagenti", filter="SQL")
+    result = asyncio.run(discovery.list_agents(namespace="kagenti", filter="SQL"))
 
     assert "Database Assistant" in result
     assert "Total: 1 agent(s)" in result
 
 
-@patch('lib.discovery.get_agents_data')
-def test_filter_searches_skill_descriptions(mock_get_agents_data):
+def test_filter_searches_skill_descriptions(mocked_discovery):
     """Test that filter searches in skill descriptions."""
-    mock_get_agents_data.return_value = (SAMPLE_AGENTS, "namespace: kagenti")
-
-    result = discovery.list_agents(namespace="kagenti", filter="forecasts")
+    result = asyncio.run(discovery.list_agents(namespace="kagenti", filter="forecasts"))
 
     assert "Weather Assistant" in result
     assert "Total: 1 agent(s)" in result
 
 
-@patch('lib.discovery.get_agents_data')
-def test_filter_with_no_matches_returns_nothing(mock_get_agents_data):
+def test_filter_with_no_matches_returns_nothing(mocked_discovery):
     """Test that filter with no matches returns appropriate message."""
-    mock_get_agents_data.return_value = (SAMPLE_AGENTS, "namespace: kagenti")
-
-    result = discovery.list_agents(namespace="kagenti", filter="nonexistent")
+    result = asyncio.run(discovery.list_agents(namespace="kagenti", filter="nonexistent"))
 
     # Should indicate no matches
     assert "No agents matching filter 'nonexistent'" in result
@@ -172,15 +159,82 @@ def test_filter_with_no_matches_returns_nothing(mock_get_agents_data):
     assert "Chat Bot" not in result
 
 
-@patch('lib.discovery.get_agents_data')
-def test_filter_matches_multiple_agents(mock_get_agents_data):
+def test_filter_matches_multiple_agents(mocked_discovery):
     """Test that filter can match multiple agents."""
-    mock_get_agents_data.return_value = (SAMPLE_AGENTS, "namespace: kagenti")
-
     # "assistant" appears in both Weather Assistant and Database Assistant
-    result = discovery.list_agents(namespace="kagenti", filter="assistant")
+    result = asyncio.run(discovery.list_agents(namespace="kagenti", filter="assistant"))
 
     assert "Weather Assistant" in result
     assert "Database Assistant" in result
     assert "Chat Bot" not in result
     assert "Total: 2 agent(s)" in result
+
+
+def test_filter_does_not_match_across_fields(mocked_discovery):
+    """Test that a filter spanning two fields does not match."""
+    # "Assistant" ends the name and "Provides" starts the description
+    result = asyncio.run(discovery.list_agents(namespace="kagenti", filter="assistant provides"))
+
+    assert "No agents matching filter 'assistant provides'" in result
+
+
+def test_filter_supports_boolean_operators(mocked_discovery):
+    """Test that AND, OR and NOT combine filter terms."""
+    result = asyncio.run(discovery.list_agents(namespace="kagenti", filter="assistant AND NOT sql"))
+    assert "Weather Assistant" in result
+    assert "Database Assistant" not in result
+    assert "Total: 1 agent(s)" in result
+
+    result = asyncio.run(discovery.list_agents(namespace="kagenti", filter="sql OR chat"))
+    assert "Database Assistant" in result
+    assert "Chat Bot" in result
+    assert "Weather Assistant" not in result
+
+
+def test_compiled_filter_precedence():
+    """Test that NOT binds tighter than AND, and AND tighter than OR."""
+    predicate = discovery._compile_filter("weather AND NOT sql OR chat bot")
+
+    matches = [agent.agent_name for agent in SAMPLE_AGENTS if predicate(agent.haystack)]
+    assert matches == ["Weather Assistant", "Chat Bot"]
+
+
+def test_or_of_phrases_matches_any_phrase():
+    """Test that alternatives are matched literally, including regex characters."""
+    predicate = discovery._compile_filter("sql query OR forecasts OR a.b")
+
+    matches = [agent.agent_name for agent in SAMPLE_AGENTS if predicate(agent.haystack)]
+    assert matches == ["Weather Assistant", "Database Assistant"]
+    assert not predicate("axb")
+
+
+def test_lowercase_keywords_are_plain_text():
+    """Test that only uppercase operators are treated as boolean keywords."""
+    assert discovery._compile_filter("weather and sql") is None
+    assert discovery._compile_filter("weather") is None
+
+
+def test_invalid_filter_expression_is_rejected():
+    """Test that an operator without an operand is reported."""
+    for expr in ["AND sql", "sql OR", "NOT", "sql AND AND weather"]:
+        with pytest.raises(ValueError):
+            discovery._compile_filter(expr)
+
+
+def test_search_text_is_lowercased_at_ingestion():
+    """Test that the filter haystack is built once when the agent is parsed."""
+    agent = SAMPLE_AGENTS[1]
+
+    assert agent.haystack == agent.haystack.lower()
+    assert "sql query" in agent.haystack
+    assert "browse database schema" in agent.haystack
+    assert "haystack" not in agent.to_dict()
+
+
+def test_skills_are_flattened_at_ingestion():
+    """Test that skill names and descriptions are kept as flat tuples."""
+    agent = SAMPLE_AGENTS[1]
+
+    assert agent.skill_names == ("SQL Query", "Schema Explorer")
+    assert agent.skill_descs == ("Execute SQL queries", "Browse database schema")
+    assert "skill_names" not in agent.to_dict()
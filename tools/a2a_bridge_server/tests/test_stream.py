@@ -0,0 +1,121 @@
+"""Test forwarding of raw streaming events."""
+
+import asyncio
+import json
+import pytest
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from a2a.client.errors import (
+    A2AClientHTTPError,
+    A2AClientJSONError,
+    A2AClientJSONRPCError,
+    A2AClientTimeoutError,
+)
+from a2a.types import SendStreamingMessageRequest
+from lib import a2a
+
+AGENT_URL = "http://agent.example/"
+
+MESSAGE_EVENT = json.dumps({
+    "jsonrpc": "2.0",
+    "id": "1",
+    "result": {
+        "kind": "message",
+        "messageId": "m1",
+        "role": "agent",
+        "parts": [{"kind": "text", "text": 'the "error" was fixed'}],
+    },
+})
+
+ERROR_EVENT = json.dumps({
+    "jsonrpc": "2.0",
+    "id": "1",
+    "error": {"code": -32603, "message": "agent exploded"},
+})
+
+
+def _sse_client(*events):
+    """httpx client whose every POST answers with the given SSE events."""
+    body = "".join(f"data: {event}\n\n" for event in events)
+
+    def handler(request):
+        return httpx.Response(
+            200, text=body, headers={"content-type": "text/event-stream"}
+        )
+
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+def _failing_client(exc):
+    def handler(request):
+        raise exc
+
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+def _request():
+    request_id, message_id = a2a._new_ids()
+    return SendStreamingMessageRequest(
+        id=request_id, params=a2a._build_message_params("hi", message_id)
+    )
+
+
+def _stream(http_client):
+    async def collect():
+        return [event async for event in a2a._stream_raw_events(AGENT_URL, _request())]
+
+    with patch.object(a2a, 'get_http_client', return_value=http_client):
+        return asyncio.run(collect())
+
+
+def test_events_are_forwarded_verbatim():
+    """Test that a message mentioning "error" in its text is not an error."""
+    assert _stream(_sse_client(MESSAGE_EVENT)) == [MESSAGE_EVENT]
+
+
+def test_error_response_is_raised():
+    """Test that a JSON-RPC error event is raised, not forwarded."""
+    with pytest.raises(A2AClientJSONRPCError, match="agent exploded"):
+        _stream(_sse_client(MESSAGE_EVENT, ERROR_EVENT))
+
+
+@pytest.mark.parametrize("event", ["{not json", "[1, 2]"])
+def test_malformed_event_is_rejected(event):
+    """Test that events which are not JSON objects are reported."""
+    with pytest.raises(A2AClientJSONError):
+        _stream(_sse_client(event))
+
+
+def test_transport_errors_are_mapped():
+    """Test that httpx errors surface as the SDK's client errors."""
+    with pytest.raises(A2AClientTimeoutError):
+        _stream(_failing_client(httpx.ReadTimeout("slow")))
+
+    with pytest.raises(A2AClientHTTPError) as excinfo:
+        _stream(_failing_client(httpx.ConnectError("refused")))
+    assert excinfo.value.status_code == 503
+
+
+def test_raw_stream_does_not_build_a2a_client():
+    """Test that the raw streaming path skips creating an A2AClient."""
+    card = SimpleNamespace(url=AGENT_URL)
+
+    async def collect():
+        return [
+            batch
+            async for batch in a2a.send_streaming_message_to_agent(AGENT_URL, "hi")
+        ]
+
+    with patch.object(a2a, '_get_agent_card', AsyncMock(return_value=(("k",), card))), \
+            patch.object(a2a, '_get_client') as mock_get_client, \
+            patch.object(a2a, 'get_http_client', return_value=_sse_client(MESSAGE_EVENT)):
+        assert asyncio.run(collect()) == [MESSAGE_EVENT]
+
+    mock_get_client.assert_not_called()
@@ -7,99 +7,243 @@ Scoped to specific namespaces via RBAC.
 """
 
 import os
+import asyncio
+import heapq
 import logging
 import sys
-from typing import Optional
-from kubernetes import client, config
-from kubernetes.client.rest import ApiException
+from datetime import datetime, timezone
+from contextlib import asynccontextmanager
+from typing import Any, Optional
+import orjson
+from kubernetes_asyncio import client, config
+from kubernetes_asyncio.client.rest import ApiException
 from fastmcp import FastMCP
 
 logger = logging.getLogger(__name__)
+# Set LOG_LEVEL=DEBUG to log every Kubernetes API request and response
 logging.basicConfig(
-    level="DEBUG",
+    level=os.getenv("LOG_LEVEL", "INFO").upper(),
     stream=sys.stdout,
     format="%(levelname)s: %(message)s",
 )
-# Initialize Kubernetes client
-try:
-    config.load_incluster_config()
-except config.ConfigException:
-    config.load_kube_config()
-
-v1 = client.CoreV1Api()
-apps_v1 = client.AppsV1Api()
-
 # Create MCP server
 mcp = FastMCP("Kubernetes Read-Only")
 
+# Page size and per-request timeout for list calls against the API server
+DEFAULT_PAGE_SIZE = 200
+MAX_PAGE_SIZE = 1000
+REQUEST_TIMEOUT = 10
+
+# Upper bounds on how much log output a single get_pod_logs call returns
+MAX_LOG_BYTES = int(os.getenv("MAX_LOG_BYTES", "1048576"))
+MAX_TAIL_LINES = 10000
+
+# Number of most recent events included by describe_pod
+DESCRIBE_POD_EVENTS = 20
+
 # Get allowed namespaces from environment
-ALLOWED_NAMESPACES = os.getenv("ALLOWED_NAMESPACES", "default").split(",")
+ALLOWED_NAMESPACES = frozenset(
+    ns.strip() for ns in os.getenv("ALLOWED_NAMESPACES", "default").split(",")
+)
+
+
+# Maximum concurrent connections the shared client opens to the API server;
+# unset keeps the client library's default (100)
+K8S_POOL = int(v) if (v := os.getenv("K8S_POOL")) else None
+
+# Shared Kubernetes API client, created on first use inside the event loop
+_api_client: Optional[client.ApiClient] = None
+_api_client_lock = asyncio.Lock()
+
+
+async def _get_api_client() -> client.ApiClient:
+    """Get the shared Kubernetes API client, loading cluster config on first use."""
+    global _api_client
+    async with _api_client_lock:
+        if _api_client is None:
+            configuration = client.Configuration()
+            try:
+                config.load_incluster_config(client_configuration=configuration)
+            except config.ConfigException:
+                await config.load_kube_config(client_configuration=configuration)
+            if K8S_POOL is not None:
+                configuration.connection_pool_maxsize = K8S_POOL
+            _api_client = client.ApiClient(configuration=configuration)
+    return _api_client
+
+
+async def _close_api_client() -> None:
+    """Close the shared Kubernetes API client, if one was created."""
+    global _api_client
+    if _api_client is not None:
+        await _api_client.close()
+        _api_client = None
+
+
+def _state(state: Optional[client.V1ContainerState]) -> Optional[dict]:
+    """Summarize a container state without serializing the whole model."""
+    if state is None:
+        return None
+    return {
+        "running": state.running is not None,
+        "waiting": state.waiting.reason if state.waiting else None,
+        "terminated": state.terminated.reason if state.terminated else None,
+    }
+
+
+def _event_info(event: client.CoreV1Event) -> dict:
+    """Summarize an event for tool responses."""
+    return {
+        "type": event.type,
+        "reason": event.reason,
+        "message": event.message,
+        "object": f"{event.involved_object.kind}/{event.involved_object.name}",
+        "count": event.count,
+        "first_timestamp": event.first_timestamp,
+        "last_timestamp": event.last_timestamp,
+    }
+
+
+def _event_time(event: client.CoreV1Event) -> datetime:
+    """When an event last occurred, for ordering events newest first."""
+    return (
+        event.last_timestamp
+        or event.event_time
+        or event.first_timestamp
+        or datetime.min.replace(tzinfo=timezone.utc)
+    )
+
+
+def _default(obj: Any) -> Any:
+    """Convert Kubernetes model objects that orjson cannot encode natively."""
+    if hasattr(obj, "to_dict"):
+        return obj.to_dict()
+    return str(obj)
+
+
+def _dumps(obj: Any) -> str:
+    """Serialize a tool response payload to a JSON string."""
+    return orjson.dumps(
+        obj, default=_default, option=orjson.OPT_NON_STR_KEYS
+    ).decode()
+
+
+def _dumps_line(obj: Any) -> bytes:
+    """Serialize one item of a list response as an NDJSON line."""
+    return orjson.dumps(
+        obj,
+        default=_default,
+        option=orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE,
+    )
+
+
+async def _list_all(list_fn, limit: int = DEFAULT_PAGE_SIZE, **kwargs):
+    """
+    Iterate over every item of a Kubernetes list call, one page at a time.
+
+    Args:
+        list_fn: Kubernetes list_namespaced_* method to call
+        limit: Maximum number of items fetched per page
+        **kwargs: Extra arguments passed to list_fn
+
+    Yields:
+        Items from each page in order
+    """
+    token = None
+    while True:
+        resp = await list_fn(
+            limit=limit, _continue=token, _request_timeout=REQUEST_TIMEOUT, **kwargs
+        )
+        for item in resp.items:
+            yield item
+        token = resp.metadata._continue
+        if not token:
+            break
+
+
+async def _collect(items) -> list:
+    """Gather the items of an async iterator into a list."""
+    return [item async for item in items]
 
 
 def validate_namespace(namespace: str) -> None:
-    return
     """Validate that namespace is in allowed list."""
     if namespace not in ALLOWED_NAMESPACES:
         raise ValueError(
-            f"Namespace '{namespace}' not allowed. Allowed namespaces: {ALLOWED_NAMESPACES}"
+            f"Namespace '{namespace}' not allowed. "
+            f"Allowed namespaces: {sorted(ALLOWED_NAMESPACES)}"
         )
 
 
+def validate_limit(limit: int) -> None:
+    """Validate that a page size is within the accepted range."""
+    if not 1 <= limit <= MAX_PAGE_SIZE:
+        raise ValueError(f"limit must be between 1 and {MAX_PAGE_SIZE}")
+
+
 @mcp.tool()
-def get_pods(namespace: str, label_selector: Optional[str] = None) -> str:
+async def get_pods(
+    namespace: str,
+    label_selector: Optional[str] = None,
+    limit: int = DEFAULT_PAGE_SIZE,
+) -> str:
     """
     List pods in a namespace.
 
     Args:
         namespace: Kubernetes namespace
         label_selector: Optional label selector (e.g., "app=myapp")
+        limit: Number of pods fetched per API page (default: 200, max: 1000)
 
     Returns:
-        JSON array of pod information
+        A "Found N pod(s)" summary line, a blank line, then one JSON
+        object per pod per line
     """
     validate_namespace(namespace)
+    validate_limit(limit)
 
     try:
-        pods = v1.list_namespaced_pod(
-            namespace=namespace, label_selector=label_selector or ""
+        v1 = client.CoreV1Api(await _get_api_client())
+        pods = _list_all(
+            v1.list_namespaced_pod,
+            limit=limit,
+            namespace=namespace,
+            label_selector=label_selector or "",
         )
 
-        pod_list = []
-        for pod in pods.items:
+        # Each item is encoded as it arrives, so only the JSON bytes are kept
+        # rather than the API objects; the body is decoded once at the end
+        body = bytearray()
+        count = 0
+        async for pod in pods:
+            statuses = pod.status.container_statuses or []
             pod_info = {
                 "name": pod.metadata.name,
                 "namespace": pod.metadata.namespace,
                 "phase": pod.status.phase,
                 "node": pod.spec.node_name,
-                "containers": [],
-                "restart_count": 0,
+                "containers": [
+                    {
+                        "name": cs.name,
+                        "ready": cs.ready,
+                        "restart_count": cs.restart_count,
+                        "state": _state(cs.state),
+                    }
+                    for cs in statuses
+                ],
+                "restart_count": sum(cs.restart_count for cs in statuses),
             }
+            body += _dumps_line(pod_info)
+            count += 1
 
-            # Container info
-            if pod.status.container_statuses:
-                for container_status in pod.status.container_statuses:
-                    pod_info["containers"].append(
-                        {
-                            "name": container_status.name,
-                            "ready": container_status.ready,
-                            "restart_count": container_status.restart_count,
-                            "state": str(container_status.state),
-                        }
-                    )
-                    pod_info["restart_count"] += container_status.restart_count
-
-            pod_list.append(pod_info)
-
-        return f"Found {len(pod_list)} pod(s) in namespace '{namespace}':\n\n" + str(
-            pod_list
-        )
+        return f"Found {count} pod(s) in namespace '{namespace}':\n\n{body.decode()}"
 
     except ApiException as e:
         raise Exception(f"Kubernetes API error: {e.reason}")
 
 
 @mcp.tool()
-def get_pod_logs(
+async def get_pod_logs(
     namespace: str,
     pod_name: str,
     container: Optional[str] = None,
@@ -112,86 +256,136 @@ def get_pod_logs(
         namespace: Kubernetes namespace
         pod_name: Name of the pod
         container: Optional container name (if pod has multiple containers)
-        tail_lines: Number of recent lines to return (default: 100)
+        tail_lines: Number of recent lines to return (default: 100, max: 10000)
 
     Returns:
-        Pod logs as text
+        Pod logs as text, truncated to MAX_LOG_BYTES
     """
     validate_namespace(namespace)
+    if tail_lines < 1:
+        raise ValueError("tail_lines must be at least 1")
+    if tail_lines > MAX_TAIL_LINES:
+        raise ValueError(f"tail_lines must be at most {MAX_TAIL_LINES}")
 
     try:
-        logs = v1.read_namespaced_pod_log(
+        v1 = client.CoreV1Api(await _get_api_client())
+        resp = await v1.read_namespaced_pod_log(
             name=pod_name,
             namespace=namespace,
             container=container,
             tail_lines=tail_lines,
+            # One byte past the cap tells us whether the output was cut off
+            limit_bytes=MAX_LOG_BYTES + 1,
+            _preload_content=False,
+            _request_timeout=REQUEST_TIMEOUT,
         )
 
-        return f"Logs for pod '{pod_name}' in namespace '{namespace}' (last {tail_lines} lines):\n\n{logs}"
+        # Read the raw body ourselves so at most MAX_LOG_BYTES are buffered.
+        # Without preloading, the client does not check the status for us.
+        chunks = []
+        remaining = MAX_LOG_BYTES + 1
+        try:
+            if not 200 <= resp.status <= 299:
+                raise ApiException(status=resp.status, reason=resp.reason)
+            async for chunk in resp.content.iter_chunked(min(remaining, 65536)):
+                chunks.append(chunk[:remaining])
+                remaining -= len(chunk)
+                if remaining <= 0:
+                    break
+        finally:
+            resp.release()
+        data = b"".join(chunks)
+
+        header = f"Logs for pod '{pod_name}' in namespace '{namespace}' (last {tail_lines} lines)"
+        if len(data) > MAX_LOG_BYTES:
+            data = data[:MAX_LOG_BYTES]
+            header += f", truncated to {MAX_LOG_BYTES} bytes"
+        logs = data.decode("utf-8", "replace")
+
+        return f"{header}:\n\n{logs}"
 
     except ApiException as e:
         raise Exception(f"Kubernetes API error: {e.reason}")
 
 
 @mcp.tool()
-def get_events(namespace: str, field_selector: Optional[str] = None) -> str:
+async def get_events(
+    namespace: str,
+    field_selector: Optional[str] = None,
+    event_type: Optional[str] = None,
+    limit: int = DEFAULT_PAGE_SIZE,
+) -> str:
     """
     List events in a namespace.
 
     Args:
         namespace: Kubernetes namespace
         field_selector: Optional field selector (e.g., "involvedObject.name=mypod")
+        event_type: Optional event type to keep (e.g., "Warning")
+        limit: Number of events fetched per API page (default: 200, max: 1000)
 
     Returns:
-        JSON array of event information
+        A "Found N event(s)" summary line, a blank line, then one JSON
+        object per event per line
     """
     validate_namespace(namespace)
+    validate_limit(limit)
 
     try:
-        events = v1.list_namespaced_event(
-            namespace=namespace, field_selector=field_selector or ""
+        # Filter on the API server rather than in Python
+        selectors = [field_selector] if field_selector else []
+        if event_type:
+            selectors.append(f"type={event_type}")
+
+        v1 = client.CoreV1Api(await _get_api_client())
+        events = _list_all(
+            v1.list_namespaced_event,
+            limit=limit,
+            namespace=namespace,
+            field_selector=",".join(selectors),
         )
 
-        event_list = []
-        for event in events.items:
-            event_info = {
-                "type": event.type,
-                "reason": event.reason,
-                "message": event.message,
-                "object": f"{event.involved_object.kind}/{event.involved_object.name}",
-                "count": event.count,
-                "first_timestamp": str(event.first_timestamp),
-                "last_timestamp": str(event.last_timestamp),
-            }
-            event_list.append(event_info)
+        # Each item is encoded as it arrives, so only the JSON bytes are kept
+        # rather than the API objects; the body is decoded once at the end
+        body = bytearray()
+        count = 0
+        async for event in events:
+            body += _dumps_line(_event_info(event))
+            count += 1
 
-        return (
-            f"Found {len(event_list)} event(s) in namespace '{namespace}':\n\n"
-            + str(event_list)
-        )
+        return f"Found {count} event(s) in namespace '{namespace}':\n\n{body.decode()}"
 
     except ApiException as e:
         raise Exception(f"Kubernetes API error: {e.reason}")
 
 
 @mcp.tool()
-def get_deployments(namespace: str) -> str:
+async def get_deployments(namespace: str, limit: int = DEFAULT_PAGE_SIZE) -> str:
     """
     List deployments in a namespace.
 
     Args:
         namespace: Kubernetes namespace
+        limit: Number of deployments fetched per API page (default: 200, max: 1000)
 
     Returns:
-        JSON array of deployment information
+        A "Found N deployment(s)" summary line, a blank line, then one JSON
+        object per deployment per line
     """
     validate_namespace(namespace)
+    validate_limit(limit)
 
     try:
-        deployments = apps_v1.list_namespaced_deployment(namespace=namespace)
+        apps_v1 = client.AppsV1Api(await _get_api_client())
+        deployments = _list_all(
+            apps_v1.list_namespaced_deployment, limit=limit, namespace=namespace
+        )
 
-        deployment_list = []
-        for deploy in deployments.items:
+        # Each item is encoded as it arrives, so only the JSON bytes are kept
+        # rather than the API objects; the body is decoded once at the end
+        body = bytearray()
+        count = 0
+        async for deploy in deployments:
             deployment_info = {
                 "name": deploy.metadata.name,
                 "namespace": deploy.metadata.namespace,
@@ -212,35 +406,42 @@ def get_deployments(namespace: str) -> str:
                         }
                     )
 
-            deployment_list.append(deployment_info)
+            body += _dumps_line(deployment_info)
+            count += 1
 
-        return (
-            f"Found {len(deployment_list)} deployment(s) in namespace '{namespace}':\n\n"
-            + str(deployment_list)
-        )
+        return f"Found {count} deployment(s) in namespace '{namespace}':\n\n{body.decode()}"
 
     except ApiException as e:
         raise Exception(f"Kubernetes API error: {e.reason}")
 
 
 @mcp.tool()
-def get_services(namespace: str) -> str:
+async def get_services(namespace: str, limit: int = DEFAULT_PAGE_SIZE) -> str:
     """
     List services in a namespace.
 
     Args:
         namespace: Kubernetes namespace
+        limit: Number of services fetched per API page (default: 200, max: 1000)
 
     Returns:
-        JSON array of service information
+        A "Found N service(s)" summary line, a blank line, then one JSON
+        object per service per line
     """
     validate_namespace(namespace)
+    validate_limit(limit)
 
     try:
-        services = v1.list_namespaced_service(namespace=namespace)
+        v1 = client.CoreV1Api(await _get_api_client())
+        services = _list_all(
+            v1.list_namespaced_service, limit=limit, namespace=namespace
+        )
 
-        service_list = []
-        for svc in services.items:
+        # Each item is encoded as it arrives, so only the JSON bytes are kept
+        # rather than the API objects; the body is decoded once at the end
+        body = bytearray()
+        count = 0
+        async for svc in services:
             service_info = {
                 "name": svc.metadata.name,
                 "namespace": svc.metadata.namespace,
@@ -255,24 +456,22 @@ def get_services(namespace: str) -> str:
                         {
                             "name": port.name,
                             "port": port.port,
-                            "target_port": str(port.target_port),
+                            "target_port": port.target_port,
                             "protocol": port.protocol,
                         }
                     )
 
-            service_list.append(service_info)
+            body += _dumps_line(service_info)
+            count += 1
 
-        return (
-            f"Found {len(service_list)} service(s) in namespace '{namespace}':\n\n"
-            + str(service_list)
-        )
+        return f"Found {count} service(s) in namespace '{namespace}':\n\n{body.decode()}"
 
     except ApiException as e:
         raise Exception(f"Kubernetes API error: {e.reason}")
 
 
 @mcp.tool()
-def describe_pod(namespace: str, pod_name: str) -> str:
+async def describe_pod(namespace: str, pod_name: str) -> str:
     """
     Get detailed information about a specific pod.
 
@@ -281,12 +480,26 @@ def describe_pod(namespace: str, pod_name: str) -> str:
         pod_name: Name of the pod
 
     Returns:
-        Detailed pod information
+        Detailed pod information, including the pod's 20 most recent events
     """
     validate_namespace(namespace)
 
     try:
-        pod = v1.read_namespaced_pod(name=pod_name, namespace=namespace)
+        v1 = client.CoreV1Api(await _get_api_client())
+        # The pod and its events are independent, so fetch them concurrently
+        pod, events = await asyncio.gather(
+            v1.read_namespaced_pod(
+                name=pod_name, namespace=namespace, _request_timeout=REQUEST_TIMEOUT
+            ),
+            _collect(
+                _list_all(
+                    v1.list_namespaced_event,
+                    namespace=namespace,
+                    field_selector=f"involvedObject.kind=Pod,involvedObject.name={pod_name}",
+                )
+            ),
+        )
+        recent_events = heapq.nlargest(DESCRIBE_POD_EVENTS, events, key=_event_time)
 
         pod_info = {
             "name": pod.metadata.name,
@@ -295,36 +508,31 @@ def describe_pod(namespace: str, pod_name: str) -> str:
             "phase": pod.status.phase,
             "node": pod.spec.node_name,
             "pod_ip": pod.status.pod_ip,
-            "start_time": str(pod.status.start_time),
-            "conditions": [],
-            "containers": [],
-        }
-
-        # Conditions
-        if pod.status.conditions:
-            for condition in pod.status.conditions:
-                pod_info["conditions"].append(
-                    {
-                        "type": condition.type,
-                        "status": condition.status,
-                        "reason": condition.reason,
-                        "message": condition.message,
-                    }
-                )
-
-        # Container details
-        if pod.status.container_statuses:
-            for container_status in pod.status.container_statuses:
-                container_info = {
-                    "name": container_status.name,
-                    "ready": container_status.ready,
-                    "restart_count": container_status.restart_count,
-                    "image": container_status.image,
-                    "state": str(container_status.state),
+            "start_time": pod.status.start_time,
+            "conditions": [
+                {
+                    "type": condition.type,
+                    "status": condition.status,
+                    "reason": condition.reason,
+                    "message": condition.message,
+                }
+                for condition in pod.status.conditions or []
+            ],
+            "containers": [
+                {
+                    "name": cs.name,
+                    "ready": cs.ready,
+                    "restart_count": cs.restart_count,
+                    "image": cs.image,
+                    "state": _state(cs.state),
                 }
-                pod_info["containers"].append(container_info)
+                for cs in pod.status.container_statuses or []
+            ],
+            "events": [_event_info(event) for event in recent_events],
+        }
 
-        return f"Detailed information for pod '{pod_name}':\n\n" + str(pod_info)
+        body = _dumps(pod_info)
+        return f"Detailed information for pod '{pod_name}':\n\n{body}"
 
     except ApiException as e:
         raise Exception(f"Kubernetes API error: {e.reason}")
@@ -340,6 +548,19 @@ def main():
         # Use modern http_app instead of deprecated sse_app
         app = mcp.http_app()
 
+        # Wrap the MCP lifespan so the Kubernetes client is closed on shutdown
+        mcp_lifespan = app.router.lifespan_context
+
+        @asynccontextmanager
+        async def lifespan(app):
+            async with mcp_lifespan(app):
+                try:
+                    yield
+                finally:
+                    await _close_api_client()
+
+        app.router.lifespan_context = lifespan
+
         uvicorn.run(app, host="0.0.0.0", port=int(port))
     else:
         # Run in STDIO mode for local testing